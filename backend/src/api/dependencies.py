@@ -1,18 +1,47 @@
+import hashlib
+import time
+from typing import Tuple
+
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from ..services.auth_service import auth_service
+from ..services.session_service import session_service
 from ..storage.memory_store import store
 from ..models.user import User
+from ..models.base import ChatSession
 
 
-# OAuth2 scheme for token authentication
+# OAuth2 scheme for token authentication. Its __call__ is a coroutine, so
+# FastAPI awaits it directly (no threadpool hop) and it also registers the
+# bearer security scheme in the OpenAPI docs.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Verified token cache: blake2b(token) -> (user, exp timestamp).
+# Entries live for at most TOKEN_CACHE_TTL_SECONDS and never past token expiry.
+TOKEN_CACHE_TTL_SECONDS = 60
+
+
+def _token_ttu(key: bytes, value: Tuple[User, float], now: float) -> float:
+    """Expire cached tokens at the earlier of the default TTL and token expiry."""
+    return min(now + TOKEN_CACHE_TTL_SECONDS, value[1])
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash the token so raw credentials are never kept in memory."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """
     Dependency to get the current authenticated user from JWT token.
     
+    Verified tokens are cached in-process, so repeat requests skip the
+    JWT decode and user lookup until the token expires.
+    
     Args:
         token: JWT token from Authorization header
         
@@ -22,6 +51,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    key = _token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached[0]
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -38,6 +72,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     if user is None:
         raise credentials_exception
     
+    if token_data.exp is not None:
+        _token_cache[key] = (user, float(token_data.exp))
+    
     return user
 
 
@@ -63,3 +100,38 @@ async def get_current_active_user(
         )
     return current_user
 
+
+
+async def get_owned_session(
+    session_id: str,
+    current_user: User = Depends(get_current_active_user)
+) -> ChatSession:
+    """
+    Dependency to get a session owned by the current user.
+    
+    Args:
+        session_id: Session identifier from the request path
+        current_user: User from get_current_active_user dependency
+        
+    Returns:
+        ChatSession belonging to the current user
+        
+    Raises:
+        HTTPException: If session not found or owned by another user
+    """
+    session = session_service.get_session(session_id)
+    
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session {session_id} not found"
+        )
+    
+    # Check authorization
+    if session.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this session"
+        )
+    
+    return session
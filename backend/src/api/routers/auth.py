@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime, timezone
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 import uuid
@@ -11,6 +13,33 @@ from ..dependencies import get_current_active_user
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
+# Short-lived per-user cache for GET /me, which frontends poll
+_user_info_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)  # user_id -> UserResponse
+
+
+def _ensure_available(user_data: UserCreate) -> None:
+    """
+    Ensure the username and email are not registered yet.
+    
+    Raises:
+        HTTPException: If username or email already exists
+    """
+    username_taken, email_taken = store.check_user_exists(
+        user_data.username,
+        user_data.email
+    )
+    if username_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
+    
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate):
@@ -26,41 +55,35 @@ async def register(user_data: UserCreate):
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username already exists
-    if store.get_user_by_username(user_data.username):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
+    # Reject duplicates before paying for the password hash
+    _ensure_available(user_data)
     
-    # Check if email already exists
-    if store.get_user_by_email(user_data.email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    # Hash off the event loop so other requests and WebSockets keep flowing
+    hashed_password = await asyncio.to_thread(auth_service.get_password_hash, user_data.password)
+    
+    # Re-check after the await: a concurrent registration may have taken the
+    # name meanwhile. There is no await between this check and create_user.
+    _ensure_available(user_data)
     
-    # Create new user
+    # Create new user (IDs stay UUIDs: the frontend schemas validate them as such)
+    now = datetime.now(timezone.utc)
     user = User(
         id=str(uuid.uuid4()),
         email=user_data.email,
         username=user_data.username,
-        hashed_password=auth_service.get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=now,
+        updated_at=now
     )
     
     # Save user to storage
     store.create_user(user)
     
     # Create tokens
-    access_token = auth_service.create_access_token(
-        data={"sub": user.id, "username": user.username}
-    )
-    refresh_token = auth_service.create_refresh_token(
-        data={"sub": user.id, "username": user.username}
-    )
+    claims = {"sub": user.id, "username": user.username}
+    access_token = auth_service.create_access_token(data=claims)
+    refresh_token = auth_service.create_refresh_token(data=claims)
     
     return Token(
         access_token=access_token,
@@ -86,14 +109,24 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     # Get user by username
     user = store.get_user_by_username(form_data.username)
     
-    # Verify user exists and password is correct
-    if not user or not auth_service.verify_password(form_data.password, user.hashed_password):
+    # Verify user exists and password is correct (hashing runs off the event loop)
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await asyncio.to_thread(
+            auth_service.verify_and_update_password, form_data.password, user.hashed_password
+        )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Upgrade legacy hashes; the store is only written from the event loop
+    if new_hash:
+        user.hashed_password = new_hash
+        store.update_user(user)
+    
     # Check if user is active
     if not user.is_active:
         raise HTTPException(
@@ -102,12 +135,9 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         )
     
     # Create tokens
-    access_token = auth_service.create_access_token(
-        data={"sub": user.id, "username": user.username}
-    )
-    refresh_token = auth_service.create_refresh_token(
-        data={"sub": user.id, "username": user.username}
-    )
+    claims = {"sub": user.id, "username": user.username}
+    access_token = auth_service.create_access_token(data=claims)
+    refresh_token = auth_service.create_refresh_token(data=claims)
     
     return Token(
         access_token=access_token,
@@ -130,9 +160,9 @@ async def refresh_token(request: RefreshTokenRequest):
     Raises:
         HTTPException: If refresh token is invalid
     """
-    # Decode refresh token
+    # Decode refresh token; access tokens must not be accepted here
     token_data = auth_service.decode_token(request.refresh_token)
-    if token_data is None or token_data.user_id is None:
+    if token_data is None or token_data.user_id is None or token_data.token_type != "refresh":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token"
@@ -153,13 +183,12 @@ async def refresh_token(request: RefreshTokenRequest):
             detail="Inactive user"
         )
     
+    _user_info_cache.pop(user.id, None)
+    
     # Create new tokens
-    access_token = auth_service.create_access_token(
-        data={"sub": user.id, "username": user.username}
-    )
-    new_refresh_token = auth_service.create_refresh_token(
-        data={"sub": user.id, "username": user.username}
-    )
+    claims = {"sub": user.id, "username": user.username}
+    access_token = auth_service.create_access_token(data=claims)
+    new_refresh_token = auth_service.create_refresh_token(data=claims)
     
     return Token(
         access_token=access_token,
@@ -179,11 +208,16 @@ async def get_current_user_info(current_user: User = Depends(get_current_active_
     Returns:
         User information (without sensitive data)
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        username=current_user.username,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at
-    )
+    user_info = _user_info_cache.get(current_user.id)
+    if user_info is None:
+        user_info = UserResponse(
+            id=current_user.id,
+            email=current_user.email,
+            username=current_user.username,
+            is_active=current_user.is_active,
+            created_at=current_user.created_at
+        )
+        _user_info_cache[current_user.id] = user_info
+    
+    return user_info
 
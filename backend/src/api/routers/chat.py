@@ -5,9 +5,10 @@ Provides HTTP endpoints for managing chat sessions and messages.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-from ...api.dependencies import get_current_active_user
+from ...api.dependencies import get_current_active_user, get_owned_session
 from ...models.user import User
 from ...models.base import (
     ChatSession,
@@ -20,13 +21,23 @@ from ...services.session_service import session_service
 from ...services.validation import ValidationError
 
 
-router = APIRouter(prefix="/api/sessions", tags=["sessions"])
+# orjson serializes the (potentially long) session/message lists much faster
+router = APIRouter(
+    prefix="/api/sessions",
+    tags=["sessions"],
+    default_response_class=ORJSONResponse
+)
 
 
 # ==================== Response Models ====================
+# Handlers return plain dicts: FastAPI validates them once against the
+# response_model adapter it builds at startup, instead of constructing a
+# model here and then dumping and re-validating it.
 
 class SessionListResponse(BaseModel):
     """Response model for session list."""
+    model_config = ConfigDict(frozen=True)
+    
     sessions: List[ChatSession]
     total: int
     active_count: int
@@ -34,6 +45,8 @@ class SessionListResponse(BaseModel):
 
 class MessageListResponse(BaseModel):
     """Response model for message list."""
+    model_config = ConfigDict(frozen=True)
+    
     messages: List[Message]
     total: int
     session_id: str
@@ -41,6 +54,8 @@ class MessageListResponse(BaseModel):
 
 class FeedbackListResponse(BaseModel):
     """Response model for feedback request list."""
+    model_config = ConfigDict(frozen=True)
+    
     feedback_requests: List[FeedbackRequest]
     total: int
     session_id: str
@@ -68,26 +83,25 @@ async def list_sessions(
         active_only=active_only
     )
     
-    active_sessions = [s for s in sessions if s.status == SessionStatus.ACTIVE]
+    if active_only:
+        active_count = len(sessions)
+    else:
+        active_count = sum(1 for s in sessions if s.status is SessionStatus.ACTIVE)
     
-    return SessionListResponse(
-        sessions=sessions,
-        total=len(sessions),
-        active_count=len(active_sessions)
-    )
+    return {
+        "sessions": sessions,
+        "total": len(sessions),
+        "active_count": active_count
+    }
 
 
 @router.get("/{session_id}", response_model=ChatSession)
-async def get_session(
-    session_id: str,
-    current_user: User = Depends(get_current_active_user)
-):
+async def get_session(session: ChatSession = Depends(get_owned_session)):
     """
     Get a specific session by ID.
     
     Args:
-        session_id: Session identifier
-        current_user: Authenticated user
+        session: Session owned by the authenticated user
         
     Returns:
         Chat session details
@@ -95,56 +109,22 @@ async def get_session(
     Raises:
         HTTPException: If session not found or unauthorized
     """
-    session = session_service.get_session(session_id)
-    
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    # Check authorization
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this session"
-        )
-    
     return session
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def end_session(
-    session_id: str,
-    current_user: User = Depends(get_current_active_user)
-):
+async def end_session(session: ChatSession = Depends(get_owned_session)):
     """
     End a chat session.
     
     Args:
-        session_id: Session identifier
-        current_user: Authenticated user
+        session: Session owned by the authenticated user
         
     Raises:
         HTTPException: If session not found or unauthorized
     """
-    session = session_service.get_session(session_id)
-    
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    # Check authorization
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this session"
-        )
-    
     try:
-        session_service.end_session(session_id)
+        session_service.end_session(session.id)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -156,17 +136,15 @@ async def end_session(
 
 @router.get("/{session_id}/messages", response_model=MessageListResponse)
 async def get_session_messages(
-    session_id: str,
     limit: Optional[int] = None,
-    current_user: User = Depends(get_current_active_user)
+    session: ChatSession = Depends(get_owned_session)
 ):
     """
     Get all messages for a session.
     
     Args:
-        session_id: Session identifier
         limit: Optional limit on number of messages
-        current_user: Authenticated user
+        session: Session owned by the authenticated user
         
     Returns:
         List of messages
@@ -174,43 +152,26 @@ async def get_session_messages(
     Raises:
         HTTPException: If session not found or unauthorized
     """
-    session = session_service.get_session(session_id)
+    messages = session_service.get_session_messages(session.id, limit=limit)
     
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    # Check authorization
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this session"
-        )
-    
-    messages = session_service.get_session_messages(session_id, limit=limit)
-    
-    return MessageListResponse(
-        messages=messages,
-        total=len(messages),
-        session_id=session_id
-    )
+    return {
+        "messages": messages,
+        "total": len(messages),
+        "session_id": session.id
+    }
 
 
 # ==================== Feedback Endpoints ====================
 
 @router.get("/{session_id}/feedback", response_model=FeedbackListResponse)
 async def get_session_feedback_requests(
-    session_id: str,
-    current_user: User = Depends(get_current_active_user)
+    session: ChatSession = Depends(get_owned_session)
 ):
     """
     Get all feedback requests for a session.
     
     Args:
-        session_id: Session identifier
-        current_user: Authenticated user
+        session: Session owned by the authenticated user
         
     Returns:
         List of feedback requests
@@ -218,51 +179,36 @@ async def get_session_feedback_requests(
     Raises:
         HTTPException: If session not found or unauthorized
     """
-    session = session_service.get_session(session_id)
-    
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    # Check authorization
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this session"
-        )
-    
-    feedback_requests = session_service.get_session_feedback_requests(session_id)
+    feedback_requests = session_service.get_session_feedback_requests(session.id)
     
-    return FeedbackListResponse(
-        feedback_requests=feedback_requests,
-        total=len(feedback_requests),
-        session_id=session_id
-    )
+    return {
+        "feedback_requests": feedback_requests,
+        "total": len(feedback_requests),
+        "session_id": session.id
+    }
 
 
 class FeedbackResponseCreate(BaseModel):
     """Request model for creating a feedback response."""
+    model_config = ConfigDict(frozen=True)
+    
     content: str
     channel: ChannelType = ChannelType.WEBSOCKET
 
 
 @router.post("/{session_id}/feedback/{request_id}/respond", status_code=status.HTTP_201_CREATED)
 async def respond_to_feedback(
-    session_id: str,
     request_id: str,
     response_data: FeedbackResponseCreate,
-    current_user: User = Depends(get_current_active_user)
+    session: ChatSession = Depends(get_owned_session)
 ):
     """
     Submit a response to a feedback request.
     
     Args:
-        session_id: Session identifier
         request_id: Feedback request identifier
         response_data: Response content and channel
-        current_user: Authenticated user
+        session: Session owned by the authenticated user
         
     Returns:
         Created feedback response
@@ -270,26 +216,12 @@ async def respond_to_feedback(
     Raises:
         HTTPException: If validation fails or unauthorized
     """
-    session = session_service.get_session(session_id)
-    
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {session_id} not found"
-        )
-    
-    # Check authorization
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this session"
-        )
-    
     try:
         feedback_response = session_service.submit_feedback_response(
             request_id=request_id,
             content=response_data.content,
-            channel=response_data.channel
+            channel=response_data.channel,
+            session_id=session.id
         )
         return feedback_response
         
@@ -2,9 +2,11 @@
 Email authentication router.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ConfigDict
 from src.api.dependencies import get_current_active_user
+from src.models.base import ChannelConnection, ChannelType
 from src.models.user import User
 from src.services.email_service import email_service
 from src.storage.memory_store import store
@@ -14,6 +16,8 @@ router = APIRouter(prefix="/api/auth/gmail", tags=["auth"])
 
 class GmailAuthResponse(BaseModel):
     """Response model for Gmail authentication."""
+    model_config = ConfigDict(frozen=True)
+    
     auth_url: str
 
 
@@ -21,7 +25,7 @@ class GmailAuthResponse(BaseModel):
 async def authorize_gmail(current_user: User = Depends(get_current_active_user)):
     """Get Gmail authorization URL."""
     auth_url = await email_service.get_auth_url()
-    return GmailAuthResponse(auth_url=auth_url)
+    return {"auth_url": auth_url}
 
 
 @router.get("/callback")
@@ -39,16 +43,22 @@ async def gmail_callback(
         # Exchange code for tokens
         token_info = await email_service.exchange_code(code)
         
-        # Store tokens for user
-        store.set_user_data(
-            current_user.id,
-            "gmail_tokens",
-            {
-                "access_token": token_info["access_token"],
-                "refresh_token": token_info.get("refresh_token"),
-                "expires_at": token_info["expires_in"]
-            }
-        )
+        # Store tokens on the user's email channel connection, keeping the
+        # existing refresh token if Google doesn't issue a new one
+        now = datetime.now(timezone.utc)
+        existing = store.get_channel_connection(current_user.id, ChannelType.EMAIL)
+        store.create_channel_connection(ChannelConnection(
+            user_id=current_user.id,
+            channel_type=ChannelType.EMAIL,
+            access_token=token_info["access_token"],
+            refresh_token=token_info.get("refresh_token") or (existing.refresh_token if existing else None),
+            token_expires_at=now + timedelta(seconds=token_info["expires_in"]),
+            scope=token_info.get("scope"),
+            extra_data=existing.extra_data if existing else None,
+            created_at=existing.created_at if existing else now,
+            updated_at=now,
+            is_active=True
+        ))
         
         return {"message": "Gmail authentication successful"}
         
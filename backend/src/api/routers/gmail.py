@@ -3,25 +3,46 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse, JSONResponse
 from datetime import datetime, timezone, timedelta
-from typing import Optional
-import secrets
+import asyncio
 
 from google_auth_oauthlib.flow import Flow
-from google.auth.transport.requests import Request as GoogleRequest
 from google.oauth2.credentials import Credentials
 
 from ...api.dependencies import get_current_user
 from ...models.user import User
 from ...models.base import ChannelConnection, ChannelType
 from ...storage.memory_store import store
+from ...services.oauth_state import create_oauth_state, verify_oauth_state
+from ...services.channels.gmail_channel import build_gmail_service
 from ...config import settings
 
 
 router = APIRouter(prefix="/api/channels/gmail", tags=["gmail"])
 
 
-# OAuth state storage (in production, use Redis or database)
-oauth_states: dict[str, str] = {}  # state -> user_id
+# OAuth client configuration (static for the lifetime of the process)
+_GMAIL_REDIRECT_URI = settings.gmail_redirect_uri or "http://localhost:8000/api/channels/gmail/callback"
+_GMAIL_SCOPES = (
+    'https://www.googleapis.com/auth/gmail.send',
+    'https://www.googleapis.com/auth/gmail.readonly',
+    'https://www.googleapis.com/auth/gmail.modify',
+    'https://www.googleapis.com/auth/userinfo.email',
+)
+_GMAIL_CLIENT_CONFIG = {
+    "web": {
+        "client_id": settings.gmail_client_id,
+        "client_secret": settings.gmail_client_secret,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "redirect_uris": [_GMAIL_REDIRECT_URI]
+    }
+}
+
+
+def _fetch_gmail_profile(credentials: Credentials) -> dict:
+    """Fetch the Gmail profile for the given credentials (blocking)."""
+    gmail_service = build_gmail_service(credentials)
+    return gmail_service.users().getProfile(userId='me').execute()
 
 
 @router.get("/auth")
@@ -38,29 +59,11 @@ async def gmail_auth(current_user: User = Depends(get_current_user)):
         )
     
     # Create OAuth flow
-    flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": settings.gmail_client_id,
-                "client_secret": settings.gmail_client_secret,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [settings.gmail_redirect_uri or "http://localhost:8000/api/channels/gmail/callback"]
-            }
-        },
-        scopes=[
-            'https://www.googleapis.com/auth/gmail.send',
-            'https://www.googleapis.com/auth/gmail.readonly',
-            'https://www.googleapis.com/auth/gmail.modify',
-            'https://www.googleapis.com/auth/userinfo.email'
-        ]
-    )
-    
-    flow.redirect_uri = settings.gmail_redirect_uri or "http://localhost:8000/api/channels/gmail/callback"
+    flow = Flow.from_client_config(_GMAIL_CLIENT_CONFIG, scopes=_GMAIL_SCOPES)
+    flow.redirect_uri = _GMAIL_REDIRECT_URI
     
-    # Generate state token for CSRF protection
-    state = secrets.token_urlsafe(32)
-    oauth_states[state] = current_user.id
+    # Generate signed state token for CSRF protection
+    state = create_oauth_state(current_user.id)
     
     # Get authorization URL
     authorization_url, _ = flow.authorization_url(
@@ -81,10 +84,10 @@ async def gmail_callback(code: str, state: str):
     Exchanges authorization code for access/refresh tokens.
     """
     # Verify state
-    if state not in oauth_states:
+    user_id = verify_oauth_state(state)
+    if user_id is None:
         raise HTTPException(status_code=400, detail="Invalid state parameter")
     
-    user_id = oauth_states.pop(state)
     user = store.get_user_by_id(user_id)
     
     if not user:
@@ -92,47 +95,29 @@ async def gmail_callback(code: str, state: str):
     
     try:
         # Create OAuth flow
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": settings.gmail_client_id,
-                    "client_secret": settings.gmail_client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [settings.gmail_redirect_uri or "http://localhost:8000/api/channels/gmail/callback"]
-                }
-            },
-            scopes=[
-                'https://www.googleapis.com/auth/gmail.send',
-                'https://www.googleapis.com/auth/gmail.readonly',
-                'https://www.googleapis.com/auth/gmail.modify',
-                'https://www.googleapis.com/auth/userinfo.email'
-            ]
-        )
-        
-        flow.redirect_uri = settings.gmail_redirect_uri or "http://localhost:8000/api/channels/gmail/callback"
+        flow = Flow.from_client_config(_GMAIL_CLIENT_CONFIG, scopes=_GMAIL_SCOPES)
+        flow.redirect_uri = _GMAIL_REDIRECT_URI
         
-        # Exchange code for tokens
-        flow.fetch_token(code=code)
+        # Exchange code for tokens (blocking HTTP, keep it off the event loop)
+        await asyncio.to_thread(flow.fetch_token, code=code)
         credentials = flow.credentials
         
         # Get user's email address
-        from googleapiclient.discovery import build
-        gmail_service = build('gmail', 'v1', credentials=credentials)
-        profile = gmail_service.users().getProfile(userId='me').execute()
+        profile = await asyncio.to_thread(_fetch_gmail_profile, credentials)
         user_email = profile.get('emailAddress')
         
         # Store connection
+        now = datetime.now(timezone.utc)
         connection = ChannelConnection(
             user_id=user_id,
             channel_type=ChannelType.EMAIL,
             access_token=credentials.token,
             refresh_token=credentials.refresh_token,
-            token_expires_at=credentials.expiry if credentials.expiry else datetime.now(timezone.utc) + timedelta(hours=1),
+            token_expires_at=credentials.expiry if credentials.expiry else now + timedelta(hours=1),
             scope=' '.join(credentials.scopes) if credentials.scopes else None,
             extra_data={'email': user_email} if user_email else None,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=now,
+            updated_at=now,
             is_active=True
         )
         
@@ -161,24 +146,21 @@ async def gmail_status(current_user: User = Depends(get_current_user)):
     connection = store.get_channel_connection(current_user.id, ChannelType.EMAIL)
     
     if not connection or not connection.is_active:
-        return {
+        status = {
             "connected": False,
             "channel_type": "email",
             "user_email": None
         }
+    else:
+        status = {
+            "connected": True,
+            "channel_type": "email",
+            "user_email": connection.extra_data.get('email') if connection.extra_data else None,
+            "token_expired": connection.token_expired,
+            "connected_at": connection.created_at.isoformat()
+        }
     
-    # Check if token is expired
-    is_expired = False
-    if connection.token_expires_at:
-        is_expired = connection.token_expires_at < datetime.now(timezone.utc)
-    
-    return {
-        "connected": True,
-        "channel_type": "email",
-        "user_email": connection.extra_data.get('email') if connection.extra_data else None,
-        "token_expired": is_expired,
-        "connected_at": connection.created_at.isoformat()
-    }
+    return status
 
 
 @router.delete("/disconnect")
@@ -4,29 +4,56 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse, JSONResponse
 from datetime import datetime, timezone
 from typing import Optional
-import secrets
+import asyncio
 import hmac
 import hashlib
-import json
+import time
+from functools import lru_cache
+from urllib.parse import parse_qs
+
+import orjson
+from cachetools import TTLCache
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from slack_sdk.oauth import AuthorizeUrlGenerator
-from slack_sdk.oauth.state_store import FileOAuthStateStore
 
 from ...api.dependencies import get_current_user
 from ...models.user import User
 from ...models.base import ChannelConnection, ChannelType
 from ...storage.memory_store import store
 from ...config import settings
+from ...services.oauth_state import create_oauth_state, verify_oauth_state
 from ...services.channels.slack_event_handler import slack_event_handler
 
 
 router = APIRouter(prefix="/api/channels/slack", tags=["slack"])
 
 
-# OAuth state storage (in production, use Redis or database)
-oauth_states: dict[str, str] = {}  # state -> user_id
+# OAuth client configuration (static for the lifetime of the process)
+_SLACK_REDIRECT_URI = settings.slack_redirect_uri or "http://localhost:8000/api/channels/slack/callback"
+_AUTHORIZE_URL_GENERATOR = AuthorizeUrlGenerator(
+    client_id=settings.slack_client_id or "",
+    scopes=[
+        "chat:write",
+        "users:read",
+        "users:read.email",
+        "im:write",
+        "im:history"
+    ],
+    user_scopes=[],
+    redirect_uri=_SLACK_REDIRECT_URI
+)
+
+# Slack's replay window for signed requests
+SIGNATURE_MAX_AGE_SECONDS = 60 * 5
+
+# Webhook bodies above this size are verified and parsed off the event loop
+OFFLOAD_BODY_BYTES = 16 * 1024
+
+# Recently handled event keys, so Slack's retries of an event are acknowledged
+# without running the handler again
+_seen_events: TTLCache = TTLCache(maxsize=10_000, ttl=300)
 
 
 @router.get("/auth")
@@ -42,27 +69,11 @@ async def slack_auth(current_user: User = Depends(get_current_user)):
             detail="Slack integration not configured"
         )
     
-    # Generate state for CSRF protection
-    state = secrets.token_urlsafe(32)
-    oauth_states[state] = current_user.id
+    # Generate signed state token for CSRF protection
+    state = create_oauth_state(current_user.id)
     
     # Create authorization URL
-    authorize_url_generator = AuthorizeUrlGenerator(
-        client_id=settings.slack_client_id,
-        scopes=[
-            "chat:write",
-            "users:read",
-            "users:read.email",
-            "im:write",
-            "im:history"
-        ],
-        user_scopes=[]
-    )
-    
-    authorization_url = authorize_url_generator.generate(
-        state=state,
-        redirect_uri=settings.slack_redirect_uri or "http://localhost:8000/api/channels/slack/callback"
-    )
+    authorization_url = _AUTHORIZE_URL_GENERATOR.generate(state=state)
     
     return {"authorization_url": authorization_url}
 
@@ -75,10 +86,10 @@ async def slack_callback(code: str, state: str):
     Exchanges authorization code for access token.
     """
     # Verify state
-    if state not in oauth_states:
+    user_id = verify_oauth_state(state)
+    if user_id is None:
         raise HTTPException(status_code=400, detail="Invalid state parameter")
     
-    user_id = oauth_states.pop(state)
     user = store.get_user_by_id(user_id)
     
     if not user:
@@ -91,7 +102,7 @@ async def slack_callback(code: str, state: str):
             client_id=settings.slack_client_id,
             client_secret=settings.slack_client_secret,
             code=code,
-            redirect_uri=settings.slack_redirect_uri or "http://localhost:8000/api/channels/slack/callback"
+            redirect_uri=_SLACK_REDIRECT_URI
         )
         
         if not response['ok']:
@@ -110,6 +121,7 @@ async def slack_callback(code: str, state: str):
         slack_user_id = authed_user.get('id')
         
         # Store connection
+        now = datetime.now(timezone.utc)
         connection = ChannelConnection(
             user_id=user_id,
             channel_type=ChannelType.SLACK,
@@ -122,8 +134,8 @@ async def slack_callback(code: str, state: str):
                 'team_id': team_id,
                 'slack_user_id': slack_user_id
             },
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=now,
+            updated_at=now,
             is_active=True
         )
         
@@ -188,6 +200,12 @@ async def slack_disconnect(current_user: User = Depends(get_current_user)):
     return {"message": "Slack disconnected successfully"}
 
 
+@lru_cache(maxsize=1)
+def _signing_hmac(signing_secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 template for the signing secret, copied per request."""
+    return hmac.new(signing_secret.encode(), digestmod=hashlib.sha256)
+
+
 def verify_slack_signature(request_body: bytes, timestamp: str, signature: str) -> bool:
     """
     Verify Slack request signature.
@@ -203,20 +221,54 @@ def verify_slack_signature(request_body: bytes, timestamp: str, signature: str)
     if not settings.slack_signing_secret:
         return False
     
-    # Create signature basestring
-    sig_basestring = f"v0:{timestamp}:".encode() + request_body
+    # Reject stale, malformed or oddly shaped requests before hashing the body
+    try:
+        request_time = int(timestamp)
+    except ValueError:
+        return False
     
-    # Calculate signature
-    my_signature = 'v0=' + hmac.new(
-        settings.slack_signing_secret.encode(),
-        sig_basestring,
-        hashlib.sha256
-    ).hexdigest()
+    if abs(time.time() - request_time) > SIGNATURE_MAX_AGE_SECONDS:
+        return False
+    
+    if len(signature) != 67 or not signature.startswith('v0='):
+        return False
+    
+    # Calculate signature over "v0:{timestamp}:{body}" without copying the body
+    mac = _signing_hmac(settings.slack_signing_secret).copy()
+    mac.update(f"v0:{timestamp}:".encode())
+    mac.update(request_body)
+    my_signature = 'v0=' + mac.hexdigest()
     
     # Compare signatures
     return hmac.compare_digest(my_signature, signature)
 
 
+def _parse_interaction_body(body: bytes) -> dict:
+    """Parse an interaction body (form-encoded 'payload=' or raw JSON)."""
+    if body.startswith(b'payload='):
+        return orjson.loads(parse_qs(body)[b'payload'][0])
+    return orjson.loads(body)
+
+
+def _event_key(payload: dict) -> Optional[str]:
+    """Identify an event callback for deduplication, or None if it can't be identified."""
+    event_id = payload.get('event_id')
+    if event_id:
+        return event_id
+    event = payload.get('event', {})
+    event_ts = event.get('event_ts') or event.get('ts')
+    if not event_ts:
+        return None
+    return f"{payload.get('team_id')}:{event.get('type')}:{event_ts}"
+
+
+async def _run_for_body(body: bytes, func, *args):
+    """Run CPU-bound webhook work inline, or in a worker thread for large bodies."""
+    if len(body) > OFFLOAD_BODY_BYTES:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
 @router.post("/events")
 async def slack_events(request: Request):
     """
@@ -232,11 +284,11 @@ async def slack_events(request: Request):
     body = await request.body()
     
     # Verify signature
-    if not verify_slack_signature(body, timestamp, signature):
+    if not await _run_for_body(body, verify_slack_signature, body, timestamp, signature):
         raise HTTPException(status_code=403, detail="Invalid signature")
     
     try:
-        payload = json.loads(body)
+        payload = await _run_for_body(body, orjson.loads, body)
         
         # Handle URL verification challenge
         if payload.get('type') == 'url_verification':
@@ -244,8 +296,21 @@ async def slack_events(request: Request):
         
         # Handle event callback
         if payload.get('type') == 'event_callback':
+            # Slack retries events it thinks failed; handle each one once
+            key = _event_key(payload)
+            if key is not None:
+                if key in _seen_events:
+                    return {"status": "ok"}
+                _seen_events[key] = True
+            
             event = payload.get('event', {})
-            await slack_event_handler.handle_event(event)
+            try:
+                await slack_event_handler.handle_event(event)
+            except Exception:
+                # Let Slack's retry through if handling failed
+                if key is not None:
+                    _seen_events.pop(key, None)
+                raise
             return {"status": "ok"}
         
         return {"status": "ok"}
@@ -272,20 +337,12 @@ async def slack_interactions(request: Request):
     body = await request.body()
     
     # Verify signature
-    if not verify_slack_signature(body, timestamp, signature):
+    if not await _run_for_body(body, verify_slack_signature, body, timestamp, signature):
         raise HTTPException(status_code=403, detail="Invalid signature")
     
     try:
         # Parse form data (Slack sends interactions as form-encoded)
-        body_str = body.decode('utf-8')
-        if body_str.startswith('payload='):
-            payload_str = body_str[8:]  # Remove 'payload=' prefix
-            # URL decode
-            import urllib.parse
-            payload_str = urllib.parse.unquote(payload_str)
-            payload = json.loads(payload_str)
-        else:
-            payload = json.loads(body_str)
+        payload = await _run_for_body(body, _parse_interaction_body, body)
         
         # Handle interaction
         response = await slack_event_handler.handle_interaction(payload)
@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
-import asyncio
-import json
+import logging
+
+import orjson
 
 from .manager import manager
 from ...models.base import (
@@ -20,10 +21,9 @@ from ...services.session_service import session_service
 from ...services.agent_service import agent_service
 from ...services.validation import ValidationError
 
-class WebSocketMessage(BaseModel):
-    type: str
-    payload: Dict
-    
+
+logger = logging.getLogger(__name__)
+
 class RateLimitInfo(BaseModel):
     limited: bool = False
     retry_after: Optional[int] = None
@@ -31,6 +31,75 @@ class RateLimitInfo(BaseModel):
     remaining: int = 0
     reset_at: float = 0
 
+
+def _parse_client_message(raw_message: str) -> Optional[Tuple[str, Dict]]:
+    """
+    Parse an inbound {"type": ..., "payload": {...}} frame.
+    
+    Args:
+        raw_message: Raw text frame from the client
+        
+    Returns:
+        (type, payload) tuple, or None if the frame is malformed
+    """
+    try:
+        message = orjson.loads(raw_message)
+    except orjson.JSONDecodeError:
+        return None
+    
+    if not isinstance(message, dict):
+        return None
+    
+    message_type = message.get("type")
+    payload = message.get("payload")
+    if not isinstance(message_type, str) or not isinstance(payload, dict):
+        return None
+    
+    return message_type, payload
+
+
+def _frame(message_type: str, payload: Dict) -> str:
+    """Serialize a WebSocket envelope to a JSON text frame."""
+    return orjson.dumps({"type": message_type, "payload": payload}).decode()
+
+
+async def _send(websocket: WebSocket, message_type: str, payload: Dict):
+    """Send a WebSocket envelope serialized with orjson."""
+    await websocket.send_text(_frame(message_type, payload))
+
+
+async def _send_batch(websocket: WebSocket, *frames: str):
+    """Send several serialized envelopes as one JSON-array text frame."""
+    await websocket.send_text(f"[{','.join(frames)}]")
+
+
+# Fixed-shape control frames, serialized once at import
+_THINKING_FRAME = _frame("agent_status", {"status": AgentStatus.THINKING.value})
+_RESPONDING_FRAME = _frame("agent_status", {"status": AgentStatus.RESPONDING.value})
+_IDLE_FRAME = _frame("agent_status", {"status": AgentStatus.IDLE.value})
+_STREAM_START_FRAME = _frame("stream_start", {})
+_STREAM_END_FRAME = _frame("stream_end", {})
+_INVALID_FORMAT_FRAME = _frame("error", {
+    "code": "INVALID_FORMAT",
+    "message": "Invalid message format"
+})
+_INVALID_MESSAGE_FRAME = _frame("error", {
+    "code": "INVALID_MESSAGE",
+    "message": "Message content is required"
+})
+_SESSION_EXISTS_FRAME = _frame("error", {
+    "code": "SESSION_EXISTS",
+    "message": "Session already started"
+})
+_NO_SESSION_FRAME = _frame("error", {
+    "code": "NO_SESSION",
+    "message": "No active session. Start a session first."
+})
+_NO_ACTIVE_SESSION_FRAME = _frame("error", {
+    "code": "NO_SESSION",
+    "message": "No active session"
+})
+
 async def handle_start_session(
     websocket: WebSocket,
     user_id: str,
@@ -70,34 +139,25 @@ async def handle_start_session(
         await manager.connect(websocket, session.id, user_id)
         
         # Send session confirmation
-        await websocket.send_json({
-            "type": "session_started",
-            "payload": {
-                "session_id": session.id,
-                "status": session.status.value,
-                "preferred_channel": session.preferred_channel.value,
-                "created_at": session.created_at.isoformat()
-            }
+        await _send(websocket, "session_started", {
+            "session_id": session.id,
+            "status": session.status,
+            "preferred_channel": session.preferred_channel,
+            "created_at": session.created_at
         })
         
         return session.id
         
     except ValidationError as e:
-        await websocket.send_json({
-            "type": "error",
-            "payload": {
-                "code": "VALIDATION_ERROR",
-                "message": str(e)
-            }
+        await _send(websocket, "error", {
+            "code": "VALIDATION_ERROR",
+            "message": str(e)
         })
         return None
     except Exception as e:
-        await websocket.send_json({
-            "type": "error",
-            "payload": {
-                "code": "SESSION_ERROR",
-                "message": f"Failed to create session: {str(e)}"
-            }
+        await _send(websocket, "error", {
+            "code": "SESSION_ERROR",
+            "message": f"Failed to create session: {str(e)}"
         })
         return None
 
@@ -125,28 +185,19 @@ async def handle_message(
                 channel="websocket"
             )
         except RateLimitExceeded as e:
-            await websocket.send_json({
-                "type": "rate_limit_exceeded",
-                "payload": {
-                    "message": e.message,
-                    "retry_after": e.retry_after,
-                    "limit": e.limit,
-                    "remaining": e.remaining,
-                    "reset_at": e.reset_at
-                }
+            await _send(websocket, "rate_limit_exceeded", {
+                "message": e.message,
+                "retry_after": e.retry_after,
+                "limit": e.limit,
+                "remaining": e.remaining,
+                "reset_at": e.reset_at
             })
             return
         
         # Get message content
         content = payload.get("content")
         if not content or not content.strip():
-            await websocket.send_json({
-                "type": "error",
-                "payload": {
-                    "code": "INVALID_MESSAGE",
-                    "message": "Message content is required"
-                }
-            })
+            await websocket.send_text(_INVALID_MESSAGE_FRAME)
             return
         
         # Get preferred channel
@@ -161,19 +212,11 @@ async def handle_message(
             channel=channel
         )
         
-        # Send confirmation
-        await websocket.send_json({
-            "type": "message_received",
-            "payload": {
-                "message_id": user_message.id,
-                "timestamp": user_message.timestamp.isoformat()
-            }
-        })
-        
-        # Update agent status to thinking
-        await websocket.send_json({
-            "type": "agent_status",
-            "payload": {"status": AgentStatus.THINKING.value}
+        # Confirmation and status updates that happen back to back go out
+        # as a single batched frame
+        received_frame = _frame("message_received", {
+            "message_id": user_message.id,
+            "timestamp": user_message.timestamp
         })
         
         # Check if streaming is requested
@@ -181,37 +224,31 @@ async def handle_message(
         
         if stream:
             # Stream response
-            await websocket.send_json({
-                "type": "agent_status",
-                "payload": {"status": AgentStatus.RESPONDING.value}
-            })
-            
-            await websocket.send_json({
-                "type": "stream_start",
-                "payload": {}
-            })
+            await _send_batch(
+                websocket,
+                received_frame,
+                _THINKING_FRAME,
+                _RESPONDING_FRAME,
+                _STREAM_START_FRAME
+            )
             
             try:
                 async for chunk in agent_service.stream_response(session_id, content):
-                    await websocket.send_json({
-                        "type": "stream_chunk",
-                        "payload": {"content": chunk}
-                    })
-                    await asyncio.sleep(0.01)  # Small delay for better streaming
+                    await websocket.send_text(_frame("stream_chunk", {"content": chunk}))
                 
-                await websocket.send_json({
-                    "type": "stream_end",
-                    "payload": {}
-                })
+                final_frame = _STREAM_END_FRAME
                 
             except Exception as e:
-                await websocket.send_json({
-                    "type": "stream_error",
-                    "payload": {"message": str(e)}
-                })
+                final_frame = _frame("stream_error", {"message": str(e)})
         else:
+            await _send_batch(
+                websocket,
+                received_frame,
+                _THINKING_FRAME
+            )
+            
             # Process based on channel
-            if channel == ChannelType.EMAIL:
+            if channel is ChannelType.EMAIL:
                 from .email_handler import handle_email_message
                 agent_message = await handle_email_message(
                     session_id=session_id,
@@ -226,37 +263,25 @@ async def handle_message(
                     channel=channel
                 )
             
-            await websocket.send_json({
-                "type": "message",
-                "payload": {
-                    "id": agent_message.id,
-                    "content": agent_message.content,
-                    "type": agent_message.type.value,
-                    "timestamp": agent_message.timestamp.isoformat()
-                }
+            final_frame = _frame("message", {
+                "id": agent_message.id,
+                "content": agent_message.content,
+                "type": agent_message.type,
+                "timestamp": agent_message.timestamp
             })
         
-        # Update agent status back to idle
-        await websocket.send_json({
-            "type": "agent_status",
-            "payload": {"status": AgentStatus.IDLE.value}
-        })
+        # Final result plus agent status back to idle
+        await _send_batch(websocket, final_frame, _IDLE_FRAME)
         
     except ValidationError as e:
-        await websocket.send_json({
-            "type": "error",
-            "payload": {
-                "code": "VALIDATION_ERROR",
-                "message": str(e)
-            }
+        await _send(websocket, "error", {
+            "code": "VALIDATION_ERROR",
+            "message": str(e)
         })
     except Exception as e:
-        await websocket.send_json({
-            "type": "error",
-            "payload": {
-                "code": "MESSAGE_ERROR",
-                "message": f"Failed to process message: {str(e)}"
-            }
+        await _send(websocket, "error", {
+            "code": "MESSAGE_ERROR",
+            "message": f"Failed to process message: {str(e)}"
         })
         
         # Update agent to error state
@@ -264,10 +289,7 @@ async def handle_message(
 
 async def handle_ping(websocket: WebSocket):
     """Handle ping/pong for connection keepalive."""
-    await websocket.send_json({
-        "type": "pong",
-        "payload": {"timestamp": datetime.now(timezone.utc).isoformat()}
-    })
+    await _send(websocket, "pong", {"timestamp": datetime.now(timezone.utc)})
 
 
 async def handle_get_rate_limit_status(
@@ -282,10 +304,7 @@ async def handle_get_rate_limit_status(
         channel="websocket"
     )
     
-    await websocket.send_json({
-        "type": "rate_limit_status",
-        "payload": status
-    })
+    await _send(websocket, "rate_limit_status", status)
 
 
 async def handle_client_connection(websocket: WebSocket, user_id: str):
@@ -310,112 +329,76 @@ async def handle_client_connection(websocket: WebSocket, user_id: str):
         await websocket.accept()
         
         # Send initial connection success message
-        await websocket.send_json({
-            "type": "connection_established",
-            "payload": {
-                "user_id": user_id,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+        await _send(websocket, "connection_established", {
+            "user_id": user_id,
+            "timestamp": datetime.now(timezone.utc)
         })
         
         while True:
             # Receive and parse message
             raw_message = await websocket.receive_text()
-            try:
-                message = WebSocketMessage.model_validate_json(raw_message)
-            except Exception as e:
-                await websocket.send_json({
-                    "type": "error",
-                    "payload": {
-                        "code": "INVALID_FORMAT",
-                        "message": "Invalid message format"
-                    }
-                })
+            message = _parse_client_message(raw_message)
+            if message is None:
+                await websocket.send_text(_INVALID_FORMAT_FRAME)
                 continue
+            message_type, payload = message
 
             # Handle different message types
-            if message.type == "start_session":
+            if message_type == "start_session":
                 if session_id:
-                    await websocket.send_json({
-                        "type": "error",
-                        "payload": {
-                            "code": "SESSION_EXISTS",
-                            "message": "Session already started"
-                        }
-                    })
+                    await websocket.send_text(_SESSION_EXISTS_FRAME)
                 else:
                     session_id = await handle_start_session(
                         websocket,
                         user_id,
-                        message.payload
+                        payload
                     )
 
-            elif message.type == "message":
+            elif message_type == "message":
                 if not session_id:
-                    await websocket.send_json({
-                        "type": "error",
-                        "payload": {
-                            "code": "NO_SESSION",
-                            "message": "No active session. Start a session first."
-                        }
-                    })
+                    await websocket.send_text(_NO_SESSION_FRAME)
                 else:
                     await handle_message(
                         websocket,
                         session_id,
                         user_id,
-                        message.payload
+                        payload
                     )
             
-            elif message.type == "ping":
+            elif message_type == "ping":
                 await handle_ping(websocket)
             
-            elif message.type == "get_rate_limit_status":
+            elif message_type == "get_rate_limit_status":
                 if session_id:
                     await handle_get_rate_limit_status(websocket, user_id, session_id)
                 else:
-                    await websocket.send_json({
-                        "type": "error",
-                        "payload": {
-                            "code": "NO_SESSION",
-                            "message": "No active session"
-                        }
-                    })
+                    await websocket.send_text(_NO_ACTIVE_SESSION_FRAME)
             
-            elif message.type == "end_session":
+            elif message_type == "end_session":
                 if session_id:
                     try:
                         session_service.end_session(session_id)
-                        await websocket.send_json({
-                            "type": "session_ended",
-                            "payload": {"session_id": session_id}
-                        })
+                        await _send(websocket, "session_ended", {"session_id": session_id})
                         manager.disconnect(session_id)
                         session_id = None
                     except Exception as e:
-                        await websocket.send_json({
-                            "type": "error",
-                            "payload": {
-                                "code": "END_SESSION_ERROR",
-                                "message": str(e)
-                            }
+                        await _send(websocket, "error", {
+                            "code": "END_SESSION_ERROR",
+                            "message": str(e)
                         })
 
             else:
-                await websocket.send_json({
-                    "type": "error",
-                    "payload": {
-                        "code": "UNKNOWN_TYPE",
-                        "message": f"Unknown message type: {message.type}"
-                    }
+                await _send(websocket, "error", {
+                    "code": "UNKNOWN_TYPE",
+                    "message": f"Unknown message type: {message_type}"
                 })
 
     except WebSocketDisconnect:
         if session_id:
             # Don't end session on disconnect - allow reconnection
             manager.disconnect(session_id)
-    except Exception as e:
+    except Exception:
         if session_id:
             manager.disconnect(session_id)
-        # Log error but don't raise to prevent server crash
-        print(f"WebSocket error: {e}")
\ No newline at end of file
+        # Log with traceback but don't raise; the connection is already unusable
+        logger.exception("WebSocket error for user %s", user_id)
\ No newline at end of file
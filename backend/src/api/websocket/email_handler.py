@@ -3,7 +3,7 @@ Email channel handler for session messages.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from typing import Dict, Optional
 
@@ -14,6 +14,10 @@ from ...services.email_service import email_service
 from ...storage.memory_store import store
 
 
+# Initial send plus one retry after a token refresh
+SEND_ATTEMPTS = 2
+
+
 async def handle_email_message(
     session_id: str,
     user_id: str,
@@ -36,14 +40,26 @@ async def handle_email_message(
     session_service.update_agent_status(session_id, AgentStatus.THINKING)
     
     try:
-        # Get Gmail tokens if not provided
+        # Look up the recipient and Gmail tokens before spending an agent call
+        user = store.get_user_by_id(user_id)
+        if not user or not user.email:
+            raise HTTPException(
+                status_code=400,
+                detail="User email not found"
+            )
+        
+        # Gmail tokens live on the user's email channel connection
+        connection = store.get_channel_connection(user_id, ChannelType.EMAIL)
         if not gmail_tokens:
-            gmail_tokens = store.get_user_data(user_id, "gmail_tokens")
-            if not gmail_tokens:
+            if not connection or not connection.is_active:
                 raise HTTPException(
                     status_code=401,
                     detail="Gmail authentication required"
                 )
+            gmail_tokens = {
+                "access_token": connection.access_token,
+                "refresh_token": connection.refresh_token
+            }
         
         # Process message via agent
         agent_message = await agent_service.process_user_message(
@@ -52,66 +68,49 @@ async def handle_email_message(
             channel=ChannelType.EMAIL
         )
         
-        # Get user's email
-        user = store.get_user(user_id)
-        if not user or not user.email:
-            raise HTTPException(
-                status_code=400,
-                detail="User email not found"
-            )
-            
-        # Send via email service
-        try:
-            sent_message = await email_service.send_message(
+        async def _send(access_token: str) -> Message:
+            return await email_service.send_message(
                 session_id=session_id,
                 content=agent_message.content,
                 to_email=user.email,
-                access_token=gmail_tokens["access_token"]
-            )
-            
-            # Update message status
-            session_service.update_message_status(
-                sent_message.id,
-                "delivered"
+                access_token=access_token
             )
-            
-            return sent_message
-            
-        except Exception as e:
-            # Try refreshing token if expired
-            if "invalid_grant" in str(e).lower() and gmail_tokens.get("refresh_token"):
-                new_tokens = await email_service.refresh_token(
-                    gmail_tokens["refresh_token"]
-                )
-                
-                # Update stored tokens
-                store.set_user_data(
-                    user_id,
-                    "gmail_tokens",
-                    {
-                        "access_token": new_tokens["access_token"],
-                        "refresh_token": gmail_tokens["refresh_token"],
-                        "expires_at": new_tokens["expires_in"]
-                    }
-                )
-                
-                # Retry with new token
-                sent_message = await email_service.send_message(
-                    session_id=session_id,
-                    content=agent_message.content,
-                    to_email=user.email,
-                    access_token=new_tokens["access_token"]
-                )
-                
-                session_service.update_message_status(
-                    sent_message.id,
-                    "delivered"
-                )
+        
+        # Send via email service, refreshing the token once if it was revoked
+        access_token = gmail_tokens["access_token"]
+        for attempt in range(SEND_ATTEMPTS):
+            try:
+                sent_message = await _send(access_token)
+                break
+            except Exception as e:
+                refresh_token = gmail_tokens.get("refresh_token")
+                if (
+                    attempt + 1 == SEND_ATTEMPTS
+                    or not refresh_token
+                    or "invalid_grant" not in str(e).casefold()
+                ):
+                    raise
                 
-                return sent_message
-            else:
-                raise
+                new_tokens = await email_service.refresh_token(refresh_token)
+                access_token = new_tokens["access_token"]
                 
+                # Update stored tokens
+                if connection:
+                    now = datetime.now(timezone.utc)
+                    store.update_channel_connection(connection.model_copy(update={
+                        "access_token": access_token,
+                        "token_expires_at": now + timedelta(seconds=new_tokens["expires_in"]),
+                        "updated_at": now
+                    }))
+        
+        # Update message status
+        session_service.update_message_status(
+            sent_message.id,
+            "delivered"
+        )
+        
+        return sent_message
+        
     except Exception as e:
         # Create error message
         error_message = session_service.create_message(
@@ -1,78 +1,107 @@
-from typing import Dict, Optional
-from fastapi import WebSocket
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 class ConnectionManager:
+    # connect() and disconnect() never await between mutations, so the event
+    # loop keeps each update atomic and no locking is needed.
     def __init__(self):
-        # Map session_id to WebSocket connection
-        self.active_connections: Dict[str, WebSocket] = {}
-        # Map session_id to user_id
-        self.session_users: Dict[str, str] = {}
-        # Map user_id to set of session_ids
-        self.user_sessions: Dict[str, set[str]] = {}
+        # Map session_id to (WebSocket connection, user_id)
+        self.connections: Dict[str, Tuple[WebSocket, str]] = {}
+        # Map user_id to number of connected sessions
+        self.user_counts: Dict[str, int] = {}
 
     async def connect(self, websocket: WebSocket, session_id: str, user_id: str):
-        """Connect and map a WebSocket to a session and user."""
-        await websocket.accept()
+        """
+        Map an already accepted WebSocket to a session and user.
         
-        # Store WebSocket connection
-        self.active_connections[session_id] = websocket
+        The connection handler accepts the socket before any session exists,
+        so this only records the mapping.
+        """
+        # Re-binding a session replaces its previous connection
+        self.disconnect(session_id)
         
-        # Map session to user
-        self.session_users[session_id] = user_id
-        
-        # Add session to user's sessions set
-        if user_id not in self.user_sessions:
-            self.user_sessions[user_id] = set()
-        self.user_sessions[user_id].add(session_id)
+        self.connections[session_id] = (websocket, user_id)
+        self.user_counts[user_id] = self.user_counts.get(user_id, 0) + 1
 
     def disconnect(self, session_id: str):
         """Clean up all mappings for a disconnected session."""
-        if session_id in self.session_users:
-            user_id = self.session_users[session_id]
-            
-            # Remove session from user's sessions
-            if user_id in self.user_sessions:
-                self.user_sessions[user_id].discard(session_id)
-                if not self.user_sessions[user_id]:
-                    del self.user_sessions[user_id]
-            
-            # Remove session mappings
-            del self.session_users[session_id]
-            
-        # Remove WebSocket connection
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
+        entry = self.connections.pop(session_id, None)
+        if entry is None:
+            return
+        
+        user_id = entry[1]
+        remaining = self.user_counts[user_id] - 1
+        if remaining:
+            self.user_counts[user_id] = remaining
+        else:
+            del self.user_counts[user_id]
 
     def get_user_session_count(self, user_id: str) -> int:
         """Get the number of active sessions for a user."""
-        return len(self.user_sessions.get(user_id, set()))
+        return self.user_counts.get(user_id, 0)
 
     def get_connection(self, session_id: str) -> Optional[WebSocket]:
         """Get the WebSocket connection for a session."""
-        return self.active_connections.get(session_id)
+        entry = self.connections.get(session_id)
+        return entry[0] if entry else None
+
+    def _user_connections(self, user_id: str) -> List[Tuple[str, WebSocket]]:
+        """Snapshot (session_id, websocket) pairs belonging to a user."""
+        if user_id not in self.user_counts:
+            return []
+        return [
+            (session_id, websocket)
+            for session_id, (websocket, owner_id) in self.connections.items()
+            if owner_id == user_id
+        ]
+
+    @staticmethod
+    def _serialize(message: Union[BaseModel, str]) -> str:
+        """Serialize a message once; pre-serialized strings pass through."""
+        return message if isinstance(message, str) else message.model_dump_json()
+
+    async def _send_all(self, targets: List[Tuple[str, WebSocket]], json_message: str):
+        """Send one serialized message to many sockets concurrently."""
+        results = await asyncio.gather(
+            *(websocket.send_text(json_message) for _, websocket in targets),
+            return_exceptions=True
+        )
+        
+        for (session_id, _), result in zip(targets, results):
+            if isinstance(result, (WebSocketDisconnect, RuntimeError, OSError)):
+                # If sending fails, clean up the connection
+                self.disconnect(session_id)
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def broadcast_to_user(self, user_id: str, message: Union[BaseModel, str]):
+        """Send a message to all sessions belonging to a user concurrently."""
+        # Snapshot targets: disconnect() mutates connections
+        targets = self._user_connections(user_id)
+        if targets:
+            await self._send_all(targets, self._serialize(message))
 
-    async def broadcast_to_user(self, user_id: str, message: BaseModel):
-        """Send a message to all sessions belonging to a user."""
-        if user_id in self.user_sessions:
-            json_message = message.model_dump_json()
-            for session_id in self.user_sessions[user_id]:
-                if websocket := self.active_connections.get(session_id):
-                    try:
-                        await websocket.send_text(json_message)
-                    except:
-                        # If sending fails, clean up the connection
-                        self.disconnect(session_id)
+    async def send_to_sessions(self, session_ids: Iterable[str], message: Union[BaseModel, str]):
+        """Send a message to several sessions, serializing it only once."""
+        targets = [
+            (session_id, websocket)
+            for session_id in session_ids
+            if (websocket := self.get_connection(session_id))
+        ]
+        if targets:
+            await self._send_all(targets, self._serialize(message))
 
-    async def send_to_session(self, session_id: str, message: BaseModel) -> bool:
+    async def send_to_session(self, session_id: str, message: Union[BaseModel, str]) -> bool:
         """Send a message to a specific session."""
-        if websocket := self.active_connections.get(session_id):
+        if websocket := self.get_connection(session_id):
             try:
-                await websocket.send_text(message.model_dump_json())
+                await websocket.send_text(self._serialize(message))
                 return True
-            except:
+            except (WebSocketDisconnect, RuntimeError, OSError):
                 self.disconnect(session_id)
         return False
 
 # Global connection manager instance
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
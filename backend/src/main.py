@@ -1,14 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from src.api.websocket.connection import handle_client_connection
 from src.api.routers import auth, chat, email
 from src.config import settings
+from src.services.auth_service import auth_service
+from src.services.channels.base_channel import BaseChannel
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm lazily initialized backends and release the shared HTTP session on shutdown."""
+    # passlib and python-jose load their crypto backends on first use
+    await asyncio.to_thread(auth_service.warm_up)
+    yield
+    await BaseChannel.close_http_session()
+
 
 app = FastAPI(
     title="Interactive Agent Chat System",
     description="WebSocket-based chat system with multi-channel feedback support",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
 # CORS Configuration - Allow frontend connections
@@ -21,8 +37,10 @@ app.add_middleware(
         "http://127.0.0.1:3000"
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let preflights answer from a fixed set instead of
+    # echoing back whatever the browser requested
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Include routers
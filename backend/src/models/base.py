@@ -1,7 +1,8 @@
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class SessionStatus(str, Enum):
     ACTIVE = "active"
@@ -46,7 +47,11 @@ class AgentStatus(str, Enum):
     RESPONDING = "responding"
     ERROR = "error"
 
+# Leaf models below are never mutated after creation, so they are frozen;
+# parents that are updated in place (Message, AgentState, ...) stay mutable.
 class MessageMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     streaming_complete: Optional[bool] = None
     error_count: Optional[int] = None
     retry_timestamp: Optional[datetime] = None
@@ -62,6 +67,8 @@ class Message(BaseModel):
     metadata: Optional[MessageMetadata] = None
 
 class FeedbackResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     request_id: str
     content: str
@@ -69,6 +76,8 @@ class FeedbackResponse(BaseModel):
     channel: ChannelType
 
 class FeedbackMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     priority: int = Field(ge=0)
     attempts_count: int = Field(ge=0)
     last_attempt: datetime
@@ -86,6 +95,8 @@ class FeedbackRequest(BaseModel):
     metadata: FeedbackMetadata
 
 class ChannelMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     last_active: datetime
     error_count: int = Field(ge=0)
     retry_timestamp: Optional[datetime] = None
@@ -97,6 +108,8 @@ class CommunicationChannel(BaseModel):
     metadata: ChannelMetadata
 
 class AgentMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     processing_time: Optional[float] = None
     error_details: Optional[str] = None
     retry_count: Optional[int] = Field(ge=0)
@@ -126,6 +139,8 @@ class ChatSession(BaseModel):
 
 class ChannelConnection(BaseModel):
     """OAuth connection for external channels"""
+    model_config = ConfigDict(validate_assignment=True)
+    
     user_id: str
     channel_type: ChannelType
     access_token: str
@@ -136,6 +151,22 @@ class ChannelConnection(BaseModel):
     created_at: datetime
     updated_at: datetime
     is_active: bool = True
+    
+    @field_validator("token_expires_at")
+    @classmethod
+    def _expiry_as_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # google-auth reports expiry as a naive UTC datetime
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+    
+    @property
+    def token_expired(self) -> bool:
+        """Whether the access token has expired (float compare, no datetime.now)."""
+        return (
+            self.token_expires_at is not None
+            and self.token_expires_at.timestamp() < time.time()
+        )
 
 class DeliveryAttempt(BaseModel):
     """Track message delivery attempts across channels"""
@@ -38,6 +38,8 @@ class TokenData(BaseModel):
     """Decoded JWT token data."""
     user_id: Optional[str] = None
     username: Optional[str] = None
+    exp: Optional[int] = None  # Expiry as a Unix timestamp
+    token_type: Optional[str] = None  # "access" or "refresh"
 
 
 class RefreshTokenRequest(BaseModel):
@@ -21,6 +21,14 @@ from .session_service import session_service
 from ..storage.memory_store import store
 
 
+# Speaker labels used in the conversation history prompt
+_ROLE: Dict[MessageType, str] = {
+    MessageType.USER: "User",
+    MessageType.AGENT: "Agent",
+    MessageType.SYSTEM: "System",
+}
+
+
 class AgentService:
     """Service for managing agent interactions via BAML."""
     
@@ -70,9 +78,6 @@ class AgentService:
                 response_content = f"I received your message: {user_message}"
                 print(f"BAML processing error: {e}")
             
-            # Update agent status to RESPONDING
-            session_service.update_agent_status(session_id, AgentStatus.RESPONDING)
-            
             # Create agent message
             agent_message = session_service.create_message(
                 session_id=session_id,
@@ -122,8 +127,8 @@ class AgentService:
             # Get conversation history
             conversation_history = self._build_conversation_history(session_id)
             
-            # Update to RESPONDING
-            session_service.update_agent_status(session_id, AgentStatus.RESPONDING)
+            # Stay THINKING until the first chunk arrives
+            responding = False
             
             # Stream via BAML
             try:
@@ -135,6 +140,9 @@ class AgentService:
                 # Yield chunks
                 async for chunk in stream:
                     if chunk:
+                        if not responding:
+                            session_service.update_agent_status(session_id, AgentStatus.RESPONDING)
+                            responding = True
                         yield chunk
                 
                 # Get final response for storage
@@ -276,15 +284,10 @@ class AgentService:
         """
         messages = session_service.get_session_messages(session_id, limit=max_messages)
         
-        if not messages:
-            return "No previous conversation."
-        
-        history_lines = []
-        for msg in messages:
-            role = "User" if msg.type == MessageType.USER else "Agent"
-            history_lines.append(f"{role}: {msg.content}")
-        
-        return "\n".join(history_lines)
+        return (
+            "\n".join(f"{_ROLE[msg.type]}: {msg.content}" for msg in messages)
+            or "No previous conversation."
+        )
     
     def get_agent_status(self, session_id: str) -> Optional[AgentStatus]:
         """Get current agent status for a session."""
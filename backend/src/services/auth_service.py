@@ -1,13 +1,36 @@
-from datetime import datetime, timezone, timedelta
-from typing import Optional
+import hashlib
+import threading
+import time
+from datetime import timedelta
+from typing import Optional, Tuple
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from ..config import settings
 from ..models.user import TokenData
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: argon2id for new hashes, bcrypt kept so legacy
+# hashes still verify and get upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
+
+
+# Token lifetimes in seconds; exp claims are plain Unix timestamps
+_ACCESS_TOKEN_SECONDS = settings.access_token_expire_minutes * 60
+_REFRESH_TOKEN_SECONDS = settings.refresh_token_expire_days * 24 * 60 * 60
+
+# Decoded token cache: blake2b(token) -> (token data, exp timestamp).
+# Keyed on a digest so raw tokens are never held; entries are also checked
+# against the token's own expiry before being returned.
+_decoded_tokens: TTLCache = TTLCache(maxsize=50_000, ttl=300)
+_decoded_tokens_lock = threading.RLock()
 
 
 class AuthService:
@@ -18,36 +41,57 @@ class AuthService:
         """Verify a plain password against a hashed password."""
         return pwd_context.verify(plain_password, hashed_password)
     
+    @staticmethod
+    def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and re-hash it with the current scheme if needed.
+        
+        Only hashes; callers persist the new hash themselves.
+        
+        Args:
+            plain_password: Password supplied by the client
+            hashed_password: Stored hash to check against
+            
+        Returns:
+            (verified, new_hash) tuple; new_hash is None unless the stored
+            hash uses a deprecated scheme or settings
+        """
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+    
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Hash a plain password."""
         return pwd_context.hash(password)
     
+    @staticmethod
+    def warm_up() -> None:
+        """Load the password hashing and JWT backends ahead of the first request."""
+        pwd_context.verify("warm-up", pwd_context.hash("warm-up"))
+        token = jwt.encode({"sub": "warm-up"}, settings.secret_key, algorithm=settings.algorithm)
+        jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token."""
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
-        
-        to_encode.update({"exp": expire, "type": "access"})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-        return encoded_jwt
+        lifetime = expires_delta.total_seconds() if expires_delta else _ACCESS_TOKEN_SECONDS
+        to_encode = {**data, "exp": int(time.time() + lifetime), "type": "access"}
+        return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     
     @staticmethod
     def create_refresh_token(data: dict) -> str:
         """Create a JWT refresh token."""
-        to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
-        to_encode.update({"exp": expire, "type": "refresh"})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-        return encoded_jwt
+        to_encode = {**data, "exp": int(time.time()) + _REFRESH_TOKEN_SECONDS, "type": "refresh"}
+        return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     
     @staticmethod
     def decode_token(token: str) -> Optional[TokenData]:
-        """Decode and validate a JWT token."""
+        """Decode and validate a JWT token (memoized until the token expires)."""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _decoded_tokens_lock:
+            cached: Optional[Tuple[TokenData, int]] = _decoded_tokens.get(key)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+        
         try:
             payload = jwt.decode(
                 token, 
@@ -60,7 +104,16 @@ class AuthService:
             if user_id is None:
                 return None
                 
-            return TokenData(user_id=user_id, username=username)
+            token_data = TokenData(
+                user_id=user_id,
+                username=username,
+                exp=payload.get("exp"),
+                token_type=payload.get("type")
+            )
+            if token_data.exp is not None:
+                with _decoded_tokens_lock:
+                    _decoded_tokens[key] = (token_data, token_data.exp)
+            return token_data
         except JWTError:
             return None
 
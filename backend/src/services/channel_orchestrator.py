@@ -1,13 +1,11 @@
 """Channel orchestrator for managing multi-channel communication."""
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-import uuid
+from typing import Dict, List, Optional, Any, Tuple
 import asyncio
+import weakref
 
 from .channels.base_channel import BaseChannel, ChannelError, ChannelConnectionError
-from .channels.gmail_channel import GmailChannel
-from .channels.slack_channel import SlackChannel
 from ..models.base import (
     Message,
     FeedbackRequest,
@@ -35,6 +33,8 @@ class ChannelOrchestrator:
         """Initialize channel orchestrator."""
         self.channels: Dict[ChannelType, BaseChannel] = {}
         self.user_channels: Dict[str, Dict[ChannelType, BaseChannel]] = {}  # user_id -> initialized channels
+        # (user_id, channel_type) -> init lock; entries drop out once no coroutine holds or awaits the lock
+        self._init_locks: weakref.WeakValueDictionary[Tuple[str, ChannelType], asyncio.Lock] = weakref.WeakValueDictionary()
         
         # Default channel priority for fallback
         self.fallback_priority = [
@@ -42,6 +42,12 @@ class ChannelOrchestrator:
             ChannelType.SLACK,
             ChannelType.EMAIL
         ]
+        
+        # Fallback order for each possible preferred channel, built once
+        self._priority_orders: Dict[Optional[ChannelType], List[ChannelType]] = {
+            preferred: list(dict.fromkeys(filter(None, [preferred, *self.fallback_priority])))
+            for preferred in [None, *ChannelType]
+        }
     
     async def initialize_user_channels(self, user_id: str) -> List[ChannelType]:
         """
@@ -53,22 +59,21 @@ class ChannelOrchestrator:
         Returns:
             List of successfully initialized channel types
         """
-        initialized = []
-        
         if user_id not in self.user_channels:
             self.user_channels[user_id] = {}
         
-        # Try to initialize each channel type
-        for channel_type in [ChannelType.EMAIL, ChannelType.SLACK]:
-            try:
-                channel = await self._get_or_create_channel(user_id, channel_type)
-                if channel and channel.status == ChannelStatus.ACTIVE:
-                    initialized.append(channel_type)
-            except Exception:
-                # Channel initialization failed, continue with others
-                pass
+        # Initialize all channel types concurrently; failures leave the others intact
+        channel_types = (ChannelType.EMAIL, ChannelType.SLACK)
+        results = await asyncio.gather(
+            *(self._get_or_create_channel(user_id, channel_type) for channel_type in channel_types),
+            return_exceptions=True
+        )
         
-        return initialized
+        return [
+            channel_type
+            for channel_type, channel in zip(channel_types, results)
+            if isinstance(channel, BaseChannel) and channel.status == ChannelStatus.ACTIVE
+        ]
     
     async def _get_or_create_channel(
         self,
@@ -85,35 +90,57 @@ class ChannelOrchestrator:
         Returns:
             Initialized channel or None
         """
-        # Check if already initialized for this user
-        if user_id in self.user_channels and channel_type in self.user_channels[user_id]:
-            channel = self.user_channels[user_id][channel_type]
-            if channel.status == ChannelStatus.ACTIVE:
-                return channel
+        channel = self._active_channel(user_id, channel_type)
+        if channel:
+            return channel
         
-        # Create new channel instance
-        channel: Optional[BaseChannel] = None
-        
-        if channel_type == ChannelType.EMAIL:
-            channel = GmailChannel()
-        elif channel_type == ChannelType.SLACK:
-            channel = SlackChannel()
-        else:
+        if channel_type not in (ChannelType.EMAIL, ChannelType.SLACK):
             return None
         
-        # Initialize channel
-        try:
-            success = await channel.initialize(user_id)
-            if success:
-                if user_id not in self.user_channels:
-                    self.user_channels[user_id] = {}
-                self.user_channels[user_id][channel_type] = channel
+        # One coroutine initializes a given channel; concurrent callers wait and reuse it
+        lock = self._init_locks.setdefault((user_id, channel_type), asyncio.Lock())
+        async with lock:
+            channel = self._active_channel(user_id, channel_type)
+            if channel:
                 return channel
-        except Exception:
-            pass
+            
+            # Create new channel instance
+            channel = self._create_channel(channel_type)
+            
+            # Initialize channel
+            try:
+                success = await channel.initialize(user_id)
+                if success:
+                    if user_id not in self.user_channels:
+                        self.user_channels[user_id] = {}
+                    self.user_channels[user_id][channel_type] = channel
+                    return channel
+            except Exception:
+                pass
         
         return None
     
+    @staticmethod
+    def _create_channel(channel_type: ChannelType) -> BaseChannel:
+        """Instantiate a channel, importing its SDK-heavy module on first use."""
+        if channel_type == ChannelType.EMAIL:
+            from .channels.gmail_channel import GmailChannel
+            return GmailChannel()
+        
+        from .channels.slack_channel import SlackChannel
+        return SlackChannel()
+    
+    def _active_channel(
+        self,
+        user_id: str,
+        channel_type: ChannelType
+    ) -> Optional[BaseChannel]:
+        """Return the user's already initialized channel if it is active."""
+        channel = self.user_channels.get(user_id, {}).get(channel_type)
+        if channel and channel.status == ChannelStatus.ACTIVE:
+            return channel
+        return None
+    
     async def send_message(
         self,
         message: Message,
@@ -144,6 +171,7 @@ class ChannelOrchestrator:
         
         # Try each channel in priority order
         last_error = None
+        subject = f"Agent Message - Session {message.session_id[:8]}"
         
         for channel_type in channels_to_try:
             # Skip WebSocket (handled separately via WebSocket connection)
@@ -161,14 +189,16 @@ class ChannelOrchestrator:
                 if not channel.circuit_breaker.can_execute():
                     continue
                 
-                # Record delivery attempt
+                # Record delivery attempt; message IDs are unique, so the
+                # attempt number makes a unique attempt ID
+                attempt_number = store.count_message_delivery_attempts(message.id) + 1
                 attempt = DeliveryAttempt(
-                    id=str(uuid.uuid4()),
+                    id=f"{message.id}-{attempt_number}",
                     message_id=message.id,
                     session_id=message.session_id,
                     channel=channel_type,
                     status=MessageStatus.SENT,
-                    attempt_number=len(store.get_message_delivery_attempts(message.id)) + 1,
+                    attempt_number=attempt_number,
                     attempted_at=datetime.now(timezone.utc)
                 )
                 store.create_delivery_attempt(attempt)
@@ -177,13 +207,13 @@ class ChannelOrchestrator:
                 success = await channel.send_message(
                     message,
                     recipient,
-                    subject=f"Agent Message - Session {message.session_id[:8]}"
+                    subject=subject
                 )
                 
                 if success:
                     # Update attempt status
                     attempt.status = MessageStatus.DELIVERED
-                    store.create_delivery_attempt(attempt)  # Update
+                    store.update_delivery_attempt(attempt)
                     return True
                 
             except ChannelError as e:
@@ -191,7 +221,7 @@ class ChannelOrchestrator:
                 # Record failed attempt
                 attempt.status = MessageStatus.FAILED
                 attempt.error_message = str(e)
-                store.create_delivery_attempt(attempt)
+                store.update_delivery_attempt(attempt)
                 
                 if not enable_fallback:
                     raise
@@ -242,30 +272,39 @@ class ChannelOrchestrator:
             if user_id in self.user_channels:
                 target_channels = list(self.user_channels[user_id].keys())
         
-        # Try to send through each channel
-        for channel_type in target_channels:
-            # Skip WebSocket
-            if channel_type == ChannelType.WEBSOCKET:
-                continue
-            
+        async def _send_one(channel_type: ChannelType) -> Optional[ChannelType]:
             try:
                 channel = await self._get_or_create_channel(user_id, channel_type)
                 
                 if not channel or not channel.circuit_breaker.can_execute():
-                    continue
+                    return None
                 
                 # Send feedback request
                 success = await channel.request_feedback(
                     feedback_request,
                     recipient
                 )
-                
-                if success:
-                    successful_channels.append(channel_type)
+                return channel_type if success else None
                 
             except ChannelError:
                 # Continue with other channels
-                continue
+                return None
+        
+        # Send through every channel concurrently (WebSocket is handled elsewhere)
+        results = await asyncio.gather(
+            *(
+                _send_one(channel_type)
+                for channel_type in target_channels
+                if channel_type != ChannelType.WEBSOCKET
+            ),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            if result:
+                successful_channels.append(result)
         
         return successful_channels
     
@@ -286,21 +325,11 @@ class ChannelOrchestrator:
         Returns:
             Ordered list of channels to try
         """
-        if not enable_fallback and preferred_channel:
-            return [preferred_channel]
-        
-        # Start with preferred channel
-        priority = []
-        if preferred_channel:
-            priority.append(preferred_channel)
-        
-        # Add fallback channels
-        if enable_fallback:
-            for channel_type in self.fallback_priority:
-                if channel_type not in priority:
-                    priority.append(channel_type)
+        if not enable_fallback:
+            return [preferred_channel] if preferred_channel else []
         
-        return priority
+        # Copy so callers can't mutate the shared order
+        return list(self._priority_orders[preferred_channel])
     
     async def get_channel_health(self, user_id: str) -> Dict[str, Any]:
         """
@@ -341,13 +370,15 @@ class ChannelOrchestrator:
         if user_id not in self.user_channels:
             return health
         
-        # Check each channel
-        for channel_type, channel in self.user_channels[user_id].items():
-            try:
-                is_healthy = await channel.check_health()
-                health[channel_type] = is_healthy
-            except Exception:
-                health[channel_type] = False
+        # Check every channel concurrently
+        channels = list(self.user_channels[user_id].items())
+        results = await asyncio.gather(
+            *(channel.check_health() for _, channel in channels),
+            return_exceptions=True
+        )
+        
+        for (channel_type, _), is_healthy in zip(channels, results):
+            health[channel_type] = False if isinstance(is_healthy, BaseException) else is_healthy
         
         return health
     
@@ -1,8 +1,6 @@
 """Channel handlers for multi-channel communication."""
 
 from .base_channel import BaseChannel, ChannelError, ChannelConnectionError, ChannelRateLimitError
-from .gmail_channel import GmailChannel
-from .slack_channel import SlackChannel
 
 __all__ = [
     "BaseChannel",
@@ -13,3 +11,13 @@ __all__ = [
     "SlackChannel",
 ]
 
+
+def __getattr__(name: str):
+    # Channel implementations pull in their SDKs, so load them on first access
+    if name == "GmailChannel":
+        from .gmail_channel import GmailChannel
+        return GmailChannel
+    if name == "SlackChannel":
+        from .slack_channel import SlackChannel
+        return SlackChannel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,13 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import ClassVar, Optional, Dict, Any
 from enum import Enum
 import asyncio
+import random
+import time
+
+import aiohttp
 
 from ...models.base import (
     Message,
@@ -47,6 +51,17 @@ class CircuitBreaker:
     temporarily blocking requests when failure threshold is exceeded.
     """
     
+    __slots__ = (
+        "failure_threshold",
+        "timeout_seconds",
+        "half_open_max_calls",
+        "state",
+        "failure_count",
+        "last_failure_time",
+        "half_open_calls",
+        "_open_until",
+    )
+    
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -61,6 +76,8 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time: Optional[datetime] = None
         self.half_open_calls = 0
+        # Monotonic deadline for leaving OPEN; last_failure_time is only reported
+        self._open_until = 0.0
     
     def can_execute(self) -> bool:
         """Check if request can be executed based on circuit state."""
@@ -69,13 +86,11 @@ class CircuitBreaker:
         
         if self.state == CircuitState.OPEN:
             # Check if timeout has elapsed
-            if self.last_failure_time:
-                elapsed = (datetime.now(timezone.utc) - self.last_failure_time).total_seconds()
-                if elapsed >= self.timeout_seconds:
-                    # Move to half-open state
-                    self.state = CircuitState.HALF_OPEN
-                    self.half_open_calls = 0
-                    return True
+            if time.monotonic() >= self._open_until:
+                # Move to half-open state
+                self.state = CircuitState.HALF_OPEN
+                self.half_open_calls = 0
+                return True
             return False
         
         if self.state == CircuitState.HALF_OPEN:
@@ -109,6 +124,10 @@ class CircuitBreaker:
                 # Threshold exceeded, open circuit
                 self.state = CircuitState.OPEN
         
+        if self.state == CircuitState.OPEN:
+            # Each failure while open restarts the timeout
+            self._open_until = time.monotonic() + self.timeout_seconds
+        
         if self.state == CircuitState.HALF_OPEN:
             self.half_open_calls += 1
     
@@ -130,6 +149,11 @@ class BaseChannel(ABC):
     including error handling, retry logic, and health monitoring.
     """
     
+    # HTTP session shared by every channel instance for connection reuse,
+    # along with the event loop it is bound to
+    _http_session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    _http_session_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    
     def __init__(self, channel_type: ChannelType, config: Optional[Dict[str, Any]] = None):
         """
         Initialize base channel.
@@ -220,6 +244,37 @@ class BaseChannel(ABC):
         """
         pass
     
+    @classmethod
+    def http_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session shared by all channels, creating it on first use.
+        
+        A session only works on the event loop it was created on, so a new
+        one is created if the running loop has changed (e.g. after an app
+        restart in the same process).
+        
+        Returns:
+            Shared aiohttp session with a pooled keep-alive connector
+        """
+        loop = asyncio.get_running_loop()
+        session = BaseChannel._http_session
+        if session is None or session.closed or BaseChannel._http_session_loop is not loop:
+            BaseChannel._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10)
+            )
+            BaseChannel._http_session_loop = loop
+        return BaseChannel._http_session
+    
+    @classmethod
+    async def close_http_session(cls):
+        """Close the shared HTTP session if it belongs to the running loop."""
+        session = BaseChannel._http_session
+        if session is not None and BaseChannel._http_session_loop is asyncio.get_running_loop():
+            await session.close()
+        BaseChannel._http_session = None
+        BaseChannel._http_session_loop = None
+    
     async def execute_with_retry(
         self,
         operation,
@@ -229,7 +284,7 @@ class BaseChannel(ABC):
         **kwargs
     ) -> Any:
         """
-        Execute an operation with exponential backoff retry.
+        Execute an operation with jittered exponential backoff retry.
         
         Args:
             operation: Async callable to execute
@@ -274,9 +329,10 @@ class BaseChannel(ABC):
                 self.error_count += 1
                 
                 if attempt < max_retries:
-                    # Calculate exponential backoff delay
+                    # Exponential backoff with equal jitter, so callers that
+                    # failed together don't all retry at the same instant
                     delay = min(base_delay * (2 ** attempt), max_delay)
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(random.uniform(delay / 2, delay))
                 else:
                     # Final attempt failed
                     self.status = ChannelStatus.ERROR
@@ -1,6 +1,8 @@
 """Gmail channel handler for email communication."""
 
+import asyncio
 import base64
+import html
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone
@@ -9,7 +11,8 @@ import json
 
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 from .base_channel import (
@@ -29,6 +32,84 @@ from ...storage.memory_store import store
 from ...config import settings
 
 
+# Gmail discovery document bundled with googleapiclient, parsed once at import.
+# build() would re-read and re-parse ~150KB of JSON on every call.
+_GMAIL_DISCOVERY_DOC = json.loads(get_static_doc('gmail', 'v1'))
+
+
+# Per-type copy for feedback emails, built once at import
+_FEEDBACK_COPY = {
+    FeedbackType.APPROVAL: {
+        'title': 'Approval',
+        'action_html': """
+            <div style="margin: 20px 0;">
+                <p><strong>Reply with one of:</strong></p>
+                <ul>
+                    <li><strong>APPROVE</strong> or <strong>YES</strong> to approve</li>
+                    <li><strong>REJECT</strong> or <strong>NO</strong> to reject</li>
+                </ul>
+            </div>
+            """,
+        'action_plain': "Reply with APPROVE/YES or REJECT/NO",
+    },
+    FeedbackType.INPUT: {
+        'title': 'Input',
+        'action_html': """
+            <div style="margin: 20px 0;">
+                <p><strong>Reply with your input:</strong></p>
+                <p>Simply reply to this email with your response.</p>
+            </div>
+            """,
+        'action_plain': "Reply with your input",
+    },
+}
+
+
+def build_gmail_service(credentials: Credentials):
+    """
+    Build a Gmail API client from the preloaded discovery document.
+    
+    Args:
+        credentials: OAuth2 credentials for the user
+        
+    Returns:
+        Gmail API service resource
+    """
+    return build_from_document(_GMAIL_DISCOVERY_DOC, credentials=credentials)
+
+
+def _build_raw_message(
+    recipient: str,
+    subject: str,
+    headers: Dict[str, str],
+    html_body: str,
+    plain_body: str
+) -> str:
+    """
+    Build a multipart/alternative email encoded for the Gmail API.
+    
+    Args:
+        recipient: Recipient email address
+        subject: Email subject line
+        headers: Extra headers such as session and request IDs
+        html_body: HTML version of the body
+        plain_body: Plain text version of the body
+        
+    Returns:
+        URL-safe base64 encoded RFC 822 message
+    """
+    mime_message = MIMEMultipart('alternative')
+    mime_message['to'] = recipient
+    mime_message['subject'] = subject
+    for name, value in headers.items():
+        mime_message[name] = value
+    
+    mime_message.attach(MIMEText(html_body, 'html'))
+    mime_message.attach(MIMEText(plain_body, 'plain'))
+    
+    return base64.urlsafe_b64encode(mime_message.as_bytes()).decode()
+
+
 class GmailChannel(BaseChannel):
     """
     Gmail channel implementation using Gmail API.
@@ -41,6 +122,8 @@ class GmailChannel(BaseChannel):
         super().__init__(ChannelType.EMAIL, config)
         self.gmail_service = None
         self.user_email: Optional[str] = None
+        # httplib2 connections aren't thread-safe; one API call at a time per channel
+        self._api_lock = asyncio.Lock()
         
         # Gmail API configuration
         self.scopes = [
@@ -77,10 +160,10 @@ class GmailChannel(BaseChannel):
                 scopes=self.scopes
             )
             
-            # Refresh token if expired
-            if connection.token_expires_at and connection.token_expires_at < datetime.now(timezone.utc):
+            # Refresh token if expired (blocking HTTP, keep it off the event loop)
+            if connection.token_expired:
                 if creds.refresh_token:
-                    creds.refresh(Request())
+                    await asyncio.to_thread(creds.refresh, Request())
                     
                     # Update stored tokens
                     connection.access_token = creds.token
@@ -90,7 +173,7 @@ class GmailChannel(BaseChannel):
                     raise ChannelConnectionError("Refresh token not available")
             
             # Build Gmail service
-            self.gmail_service = build('gmail', 'v1', credentials=creds)
+            self.gmail_service = build_gmail_service(creds)
             
             # Get user email from extra_data
             if connection.extra_data and 'email' in connection.extra_data:
@@ -104,6 +187,22 @@ class GmailChannel(BaseChannel):
             self.status = ChannelStatus.ERROR
             raise ChannelConnectionError(f"Failed to initialize Gmail: {str(e)}")
     
+    async def _execute(self, request) -> Dict[str, Any]:
+        """
+        Execute a Gmail API request in a worker thread.
+        
+        Calls on this channel are serialized, while other users' channels
+        run in parallel without blocking the event loop.
+        
+        Args:
+            request: googleapiclient HttpRequest to execute
+            
+        Returns:
+            Decoded API response
+        """
+        async with self._api_lock:
+            return await asyncio.to_thread(request.execute)
+    
     async def send_message(
         self,
         message: Message,
@@ -126,31 +225,23 @@ class GmailChannel(BaseChannel):
         if not self.gmail_service:
             raise ChannelConnectionError("Gmail service not initialized")
         
+        # MIME generation is CPU-bound; build once per call, off the event loop
+        raw_message = await asyncio.to_thread(
+            _build_raw_message,
+            recipient,
+            subject or f"Message from Agent - Session {message.session_id[:8]}",
+            # Session ID headers for threading
+            {'X-Session-ID': message.session_id, 'X-Message-ID': message.id},
+            self._format_message_html(message),
+            message.content
+        )
+        
         async def _send():
             try:
-                # Create email message
-                mime_message = MIMEMultipart('alternative')
-                mime_message['to'] = recipient
-                mime_message['subject'] = subject or f"Message from Agent - Session {message.session_id[:8]}"
-                
-                # Add session ID to headers for threading
-                mime_message['X-Session-ID'] = message.session_id
-                mime_message['X-Message-ID'] = message.id
-                
-                # Create HTML version
-                html_content = self._format_message_html(message)
-                mime_message.attach(MIMEText(html_content, 'html'))
-                
-                # Create plain text version
-                mime_message.attach(MIMEText(message.content, 'plain'))
-                
-                # Encode and send
-                raw_message = base64.urlsafe_b64encode(mime_message.as_bytes()).decode()
-                
-                send_result = self.gmail_service.users().messages().send(
+                send_result = await self._execute(self.gmail_service.users().messages().send(
                     userId='me',
                     body={'raw': raw_message}
-                ).execute()
+                ))
                 
                 return bool(send_result.get('id'))
                 
@@ -191,37 +282,31 @@ class GmailChannel(BaseChannel):
         if not self.gmail_service:
             raise ChannelConnectionError("Gmail service not initialized")
         
+        copy = _FEEDBACK_COPY[feedback_request.type]
+        subject = f"{copy['title']} Required - {feedback_request.prompt[:50]}"
+        expires = feedback_request.expires_at.strftime('%Y-%m-%d %H:%M:%S UTC')
+        
+        # MIME generation is CPU-bound; build once per call, off the event loop
+        raw_message = await asyncio.to_thread(
+            _build_raw_message,
+            recipient,
+            subject,
+            # Tracking headers
+            {
+                'X-Session-ID': feedback_request.session_id,
+                'X-Feedback-Request-ID': feedback_request.id,
+                'X-Feedback-Type': feedback_request.type.value,
+            },
+            self._format_feedback_html(feedback_request, expires),
+            self._format_feedback_plain(feedback_request, expires)
+        )
+        
         async def _send():
             try:
-                # Create email message
-                mime_message = MIMEMultipart('alternative')
-                mime_message['to'] = recipient
-                
-                if feedback_request.type == FeedbackType.APPROVAL:
-                    mime_message['subject'] = f"Approval Required - {feedback_request.prompt[:50]}"
-                else:
-                    mime_message['subject'] = f"Input Required - {feedback_request.prompt[:50]}"
-                
-                # Add tracking headers
-                mime_message['X-Session-ID'] = feedback_request.session_id
-                mime_message['X-Feedback-Request-ID'] = feedback_request.id
-                mime_message['X-Feedback-Type'] = feedback_request.type.value
-                
-                # Create HTML version
-                html_content = self._format_feedback_html(feedback_request)
-                mime_message.attach(MIMEText(html_content, 'html'))
-                
-                # Create plain text version
-                plain_content = self._format_feedback_plain(feedback_request)
-                mime_message.attach(MIMEText(plain_content, 'plain'))
-                
-                # Encode and send
-                raw_message = base64.urlsafe_b64encode(mime_message.as_bytes()).decode()
-                
-                send_result = self.gmail_service.users().messages().send(
+                send_result = await self._execute(self.gmail_service.users().messages().send(
                     userId='me',
                     body={'raw': raw_message}
-                ).execute()
+                ))
                 
                 return bool(send_result.get('id'))
                 
@@ -252,7 +337,7 @@ class GmailChannel(BaseChannel):
         
         try:
             # Simple API call to check connectivity
-            self.gmail_service.users().getProfile(userId='me').execute()
+            await self._execute(self.gmail_service.users().getProfile(userId='me'))
             self.status = ChannelStatus.ACTIVE
             self.last_health_check = datetime.now(timezone.utc)
             return True
@@ -283,7 +368,7 @@ class GmailChannel(BaseChannel):
                 </div>
                 <div class="content">
                     <div class="message">
-                        <p>{message.content}</p>
+                        <p>{html.escape(message.content)}</p>
                     </div>
                     <p class="timestamp">Sent: {message.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
                 </div>
@@ -296,25 +381,9 @@ class GmailChannel(BaseChannel):
         </html>
         """
     
-    def _format_feedback_html(self, feedback_request: FeedbackRequest) -> str:
-        """Format feedback request as HTML email."""
-        if feedback_request.type == FeedbackType.APPROVAL:
-            action_section = """
-            <div style="margin: 20px 0;">
-                <p><strong>Reply with one of:</strong></p>
-                <ul>
-                    <li><strong>APPROVE</strong> or <strong>YES</strong> to approve</li>
-                    <li><strong>REJECT</strong> or <strong>NO</strong> to reject</li>
-                </ul>
-            </div>
-            """
-        else:
-            action_section = """
-            <div style="margin: 20px 0;">
-                <p><strong>Reply with your input:</strong></p>
-                <p>Simply reply to this email with your response.</p>
-            </div>
-            """
+    def _format_feedback_html(self, feedback_request: FeedbackRequest, expires: str) -> str:
+        """Format feedback request as HTML email, with a preformatted expiry time."""
+        copy = _FEEDBACK_COPY[feedback_request.type]
         
         return f"""
         <!DOCTYPE html>
@@ -333,14 +402,14 @@ class GmailChannel(BaseChannel):
         <body>
             <div class="container">
                 <div class="header">
-                    <h2>{'Approval' if feedback_request.type == FeedbackType.APPROVAL else 'Input'} Required</h2>
+                    <h2>{copy['title']} Required</h2>
                 </div>
                 <div class="content">
                     <div class="request">
-                        <p>{feedback_request.prompt}</p>
+                        <p>{html.escape(feedback_request.prompt)}</p>
                     </div>
-                    {action_section}
-                    <p class="expires">Expires: {feedback_request.expires_at.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+                    {copy['action_html']}
+                    <p class="expires">Expires: {expires}</p>
                 </div>
                 <div class="footer">
                     <p>Session ID: {feedback_request.session_id}</p>
@@ -351,21 +420,18 @@ class GmailChannel(BaseChannel):
         </html>
         """
     
-    def _format_feedback_plain(self, feedback_request: FeedbackRequest) -> str:
-        """Format feedback request as plain text email."""
-        if feedback_request.type == FeedbackType.APPROVAL:
-            action = "Reply with APPROVE/YES or REJECT/NO"
-        else:
-            action = "Reply with your input"
+    def _format_feedback_plain(self, feedback_request: FeedbackRequest, expires: str) -> str:
+        """Format feedback request as plain text email, with a preformatted expiry time."""
+        copy = _FEEDBACK_COPY[feedback_request.type]
         
         return f"""
-{'APPROVAL' if feedback_request.type == FeedbackType.APPROVAL else 'INPUT'} REQUIRED
+{copy['title'].upper()} REQUIRED
 
 {feedback_request.prompt}
 
-{action}
+{copy['action_plain']}
 
-Expires: {feedback_request.expires_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
+Expires: {expires}
 
 ---
 Session ID: {feedback_request.session_id}
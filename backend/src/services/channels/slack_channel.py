@@ -2,9 +2,9 @@
 
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-import json
 
-from slack_sdk import WebClient
+import orjson
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 from .base_channel import (
@@ -35,7 +35,7 @@ class SlackChannel(BaseChannel):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize Slack channel."""
         super().__init__(ChannelType.SLACK, config)
-        self.slack_client: Optional[WebClient] = None
+        self.slack_client: Optional[AsyncWebClient] = None
         self.bot_user_id: Optional[str] = None
     
     async def initialize(self, user_id: str) -> bool:
@@ -56,15 +56,18 @@ class SlackChannel(BaseChannel):
                 self.status = ChannelStatus.INACTIVE
                 return False
             
-            # Create Slack client with bot token
-            self.slack_client = WebClient(token=connection.access_token)
+            # Create Slack client with bot token on the shared HTTP session
+            self.slack_client = AsyncWebClient(
+                token=connection.access_token,
+                session=self.http_session()
+            )
             
             # Get bot user ID from extra_data
             if connection.extra_data and 'bot_user_id' in connection.extra_data:
                 self.bot_user_id = connection.extra_data['bot_user_id']
             
             # Test authentication
-            response = self.slack_client.auth_test()
+            response = await self.slack_client.auth_test()
             if not response['ok']:
                 raise ChannelConnectionError("Slack authentication failed")
             
@@ -99,13 +102,12 @@ class SlackChannel(BaseChannel):
         if not self.slack_client:
             raise ChannelConnectionError("Slack client not initialized")
         
+        # Blocks don't change between attempts; build them once per call
+        blocks = self._format_message_blocks(message)
+        
         async def _send():
             try:
-                # Format message blocks
-                blocks = self._format_message_blocks(message)
-                
-                # Send message
-                response = self.slack_client.chat_postMessage(
+                response = await self.slack_client.chat_postMessage(
                     channel=recipient,
                     text=message.content,  # Fallback text
                     blocks=blocks,
@@ -157,13 +159,12 @@ class SlackChannel(BaseChannel):
         if not self.slack_client:
             raise ChannelConnectionError("Slack client not initialized")
         
+        # Blocks don't change between attempts; build them once per call
+        blocks = self._format_feedback_blocks(feedback_request)
+        
         async def _send():
             try:
-                # Format feedback blocks with buttons
-                blocks = self._format_feedback_blocks(feedback_request)
-                
-                # Send message
-                response = self.slack_client.chat_postMessage(
+                response = await self.slack_client.chat_postMessage(
                     channel=recipient,
                     text=feedback_request.prompt,  # Fallback text
                     blocks=blocks,
@@ -205,7 +206,7 @@ class SlackChannel(BaseChannel):
             return False
         
         try:
-            response = self.slack_client.auth_test()
+            response = await self.slack_client.auth_test()
             self.status = ChannelStatus.ACTIVE if response['ok'] else ChannelStatus.ERROR
             self.last_health_check = datetime.now(timezone.utc)
             return response['ok']
@@ -279,11 +280,11 @@ class SlackChannel(BaseChannel):
                         },
                         "style": "primary",
                         "action_id": "approve",
-                        "value": json.dumps({
+                        "value": orjson.dumps({
                             "request_id": feedback_request.id,
                             "session_id": feedback_request.session_id,
                             "action": "approve"
-                        })
+                        }).decode()
                     },
                     {
                         "type": "button",
@@ -293,11 +294,11 @@ class SlackChannel(BaseChannel):
                         },
                         "style": "danger",
                         "action_id": "reject",
-                        "value": json.dumps({
+                        "value": orjson.dumps({
                             "request_id": feedback_request.id,
                             "session_id": feedback_request.session_id,
                             "action": "reject"
-                        })
+                        }).decode()
                     }
                 ]
             })
@@ -315,11 +316,11 @@ class SlackChannel(BaseChannel):
                         },
                         "style": "primary",
                         "action_id": "provide_input",
-                        "value": json.dumps({
+                        "value": orjson.dumps({
                             "request_id": feedback_request.id,
                             "session_id": feedback_request.session_id,
                             "action": "input"
-                        })
+                        }).decode()
                     }
                 ]
             })
@@ -12,6 +12,12 @@ from fastapi import HTTPException
 from ..config import settings
 from ..models.base import Message, ChannelType, MessageType
 from .session_service import session_service
+from .channels.base_channel import BaseChannel
+
+
+# Upper bound for a single Google OAuth or Gmail API call
+HTTP_TIMEOUT_SECONDS = 15
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
 
 
 class EmailService:
@@ -21,7 +27,17 @@ class EmailService:
         """Initialize the email service."""
         self.token_cache: Dict[str, Dict] = {}  # user_id -> token info
         self.base_url = "https://gmail.googleapis.com"
+    
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        """
+        HTTP session shared with the channel handlers.
         
+        Reusing one pooled session keeps TLS connections to Google alive
+        between token exchanges and sends; BaseChannel owns its lifecycle.
+        """
+        return BaseChannel.http_session()
+    
     async def get_auth_url(self) -> str:
         """Get the Gmail OAuth2 authorization URL."""
         scope = "https://www.googleapis.com/auth/gmail.send"
@@ -40,42 +56,42 @@ class EmailService:
         
     async def exchange_code(self, code: str) -> Dict:
         """Exchange authorization code for access token."""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "client_id": settings.gmail_client_id,
-                    "client_secret": settings.gmail_client_secret,
-                    "code": code,
-                    "redirect_uri": settings.gmail_redirect_uri,
-                    "grant_type": "authorization_code"
-                }
-            ) as resp:
-                if resp.status != 200:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Failed to exchange authorization code"
-                    )
-                return await resp.json()
+        async with self.http.post(
+            "https://oauth2.googleapis.com/token",
+            timeout=_HTTP_TIMEOUT,
+            data={
+                "client_id": settings.gmail_client_id,
+                "client_secret": settings.gmail_client_secret,
+                "code": code,
+                "redirect_uri": settings.gmail_redirect_uri,
+                "grant_type": "authorization_code"
+            }
+        ) as resp:
+            if resp.status != 200:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Failed to exchange authorization code"
+                )
+            return await resp.json()
                 
     async def refresh_token(self, refresh_token: str) -> Dict:
         """Refresh access token using refresh token."""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "client_id": settings.gmail_client_id,
-                    "client_secret": settings.gmail_client_secret,
-                    "refresh_token": refresh_token,
-                    "grant_type": "refresh_token"
-                }
-            ) as resp:
-                if resp.status != 200:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Failed to refresh token"
-                    )
-                return await resp.json()
+        async with self.http.post(
+            "https://oauth2.googleapis.com/token",
+            timeout=_HTTP_TIMEOUT,
+            data={
+                "client_id": settings.gmail_client_id,
+                "client_secret": settings.gmail_client_secret,
+                "refresh_token": refresh_token,
+                "grant_type": "refresh_token"
+            }
+        ) as resp:
+            if resp.status != 200:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Failed to refresh token"
+                )
+            return await resp.json()
 
     async def send_message(
         self,
@@ -96,22 +112,22 @@ class EmailService:
         ).decode("utf-8")
         
         # Send via Gmail API
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
-            async with session.post(
-                f"{self.base_url}/gmail/v1/users/me/messages/send",
-                headers=headers,
-                json={"raw": raw}
-            ) as resp:
-                if resp.status != 200:
-                    raise HTTPException(
-                        status_code=500,
-                        detail="Failed to send email"
-                    )
-                result = await resp.json()
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+        async with self.http.post(
+            f"{self.base_url}/gmail/v1/users/me/messages/send",
+            timeout=_HTTP_TIMEOUT,
+            headers=headers,
+            json={"raw": raw}
+        ) as resp:
+            if resp.status != 200:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Failed to send email"
+                )
+            result = await resp.json()
                 
         # Create message record
         email_message = session_service.create_message(
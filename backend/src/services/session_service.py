@@ -338,7 +338,8 @@ class SessionService:
         self,
         request_id: str,
         content: str,
-        channel: ChannelType
+        channel: ChannelType,
+        session_id: Optional[str] = None
     ) -> FeedbackResponse:
         """
         Submit a response to a feedback request.
@@ -349,6 +350,7 @@ class SessionService:
             request_id: Feedback request identifier
             content: Response content
             channel: Channel used for response
+            session_id: If given, the request must belong to this session
             
         Returns:
             Created FeedbackResponse
@@ -356,9 +358,9 @@ class SessionService:
         Raises:
             ValidationError: If validation fails
         """
-        # Get request
+        # Get request (scoped to the caller's session when known)
         request = store.get_feedback_request(request_id)
-        if not request:
+        if not request or (session_id is not None and request.session_id != session_id):
             raise ValidationError(f"FeedbackRequest {request_id} not found")
         
         # Check if already processed
@@ -368,14 +370,14 @@ class SessionService:
             )
         
         # Check expiration
-        if request.expires_at < datetime.now(timezone.utc):
+        now = datetime.now(timezone.utc)
+        if request.expires_at < now:
             # Update request status
             request.status = FeedbackStatus.EXPIRED
             store.update_feedback_request(request)
             raise ValidationError(f"FeedbackRequest {request_id} has expired")
         
         # Create response
-        now = datetime.now(timezone.utc)
         response = FeedbackResponse(
             id=str(uuid4()),
             request_id=request_id,
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from ..models.user import User
 from ..models.base import (
@@ -15,7 +15,16 @@ from ..models.base import (
 
 
 class MemoryStore:
-    """In-memory storage for users, sessions, messages, feedback, and rate limiting."""
+    """
+    In-memory storage for users, sessions, messages, feedback, and rate limiting.
+    
+    State lives in this process only and is not locked: callers must only
+    touch the store from the event loop thread. Blocking work offloaded with
+    asyncio.to_thread returns its results, and the caller writes them back
+    once it resumes on the loop. Running several uvicorn workers would give
+    each worker its own store, so scaling out requires a shared backend such
+    as Redis in place of this class.
+    """
     
     def __init__(self):
         # User storage
@@ -74,6 +83,10 @@ class MemoryStore:
         user_id = self.users_by_email.get(email)
         return self.users.get(user_id) if user_id else None
     
+    def check_user_exists(self, username: str, email: str) -> Tuple[bool, bool]:
+        """Check whether a username and an email are already taken."""
+        return username in self.users_by_username, email in self.users_by_email
+    
     def update_user(self, user: User) -> User:
         """Update an existing user."""
         if user.id in self.users:
@@ -406,6 +419,16 @@ class MemoryStore:
         """Get delivery attempt by ID."""
         return self.delivery_attempts.get(attempt_id)
     
+    def update_delivery_attempt(self, attempt: DeliveryAttempt) -> DeliveryAttempt:
+        """Update an existing delivery attempt."""
+        if attempt.id in self.delivery_attempts:
+            self.delivery_attempts[attempt.id] = attempt
+        return attempt
+    
+    def count_message_delivery_attempts(self, message_id: str) -> int:
+        """Count delivery attempts for a message without materializing them."""
+        return len(self.message_attempts.get(message_id, ()))
+    
     def get_message_delivery_attempts(self, message_id: str) -> List[DeliveryAttempt]:
         """Get all delivery attempts for a message."""
         attempt_ids = self.message_attempts.get(message_id, [])
@@ -0,0 +1,159 @@
+"""Tests for authentication service."""
+
+import pytest
+from datetime import datetime, timezone
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+import time
+import uuid
+
+from src.config import settings
+from src.api.routers import auth
+from src.services.auth_service import auth_service
+from src.models.user import User
+from src.storage.memory_store import store
+
+
+@pytest.fixture
+def legacy_user():
+    """Create a stored user with a legacy bcrypt hash."""
+    user = User(
+        id=str(uuid.uuid4()),
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        username=f"user_{uuid.uuid4().hex[:8]}",
+        hashed_password=CryptContext(schemes=["bcrypt"]).hash("password123"),
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc)
+    )
+    return store.create_user(user)
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the auth router."""
+    app = FastAPI()
+    app.include_router(auth.router)
+    return TestClient(app)
+
+
+def login(client, user: User, password: str):
+    """Log in through the password flow endpoint."""
+    return client.post(
+        "/api/auth/login",
+        data={"username": user.username, "password": password}
+    )
+
+
+class TestPasswordHashing:
+    """Test password hashing and verification."""
+    
+    def test_new_hashes_use_argon2id(self):
+        """Test new passwords are hashed with argon2id."""
+        hashed = auth_service.get_password_hash("password123")
+        
+        assert hashed.startswith("$argon2id$")
+        assert auth_service.verify_password("password123", hashed)
+        assert not auth_service.verify_password("wrong-password", hashed)
+    
+    def test_legacy_bcrypt_hash_needs_update(self, legacy_user):
+        """Test bcrypt hashes still verify and come back re-hashed with argon2id."""
+        verified, new_hash = auth_service.verify_and_update_password("password123", legacy_user.hashed_password)
+        
+        assert verified
+        assert new_hash.startswith("$argon2id$")
+        assert auth_service.verify_password("password123", new_hash)
+    
+    def test_login_upgrades_legacy_hash(self, client, legacy_user):
+        """Test a successful login persists the upgraded hash."""
+        assert login(client, legacy_user, "password123").status_code == 200
+        
+        stored = store.get_user_by_id(legacy_user.id)
+        assert stored.hashed_password.startswith("$argon2id$")
+        assert auth_service.verify_password("password123", stored.hashed_password)
+    
+    def test_wrong_password_does_not_upgrade(self, client, legacy_user):
+        """Test failed logins leave the stored hash untouched."""
+        original_hash = legacy_user.hashed_password
+        
+        assert login(client, legacy_user, "wrong-password").status_code == 401
+        assert store.get_user_by_id(legacy_user.id).hashed_password == original_hash
+
+
+class TestUserExists:
+    """Test combined username/email uniqueness check."""
+    
+    def test_check_user_exists(self, legacy_user):
+        """Test each field is reported independently."""
+        assert store.check_user_exists(legacy_user.username, "new@example.com") == (True, False)
+        assert store.check_user_exists("new_user", legacy_user.email) == (False, True)
+        assert store.check_user_exists("new_user", "new@example.com") == (False, False)
+
+
+class TestTokenDecoding:
+    """Test JWT decoding."""
+    
+    def test_decode_token_round_trip(self):
+        """Test decoded tokens (fresh and cached) carry the original claims."""
+        token = auth_service.create_access_token(data={"sub": "user-1", "username": "alice"})
+        
+        first = auth_service.decode_token(token)
+        second = auth_service.decode_token(token)
+        
+        assert first.user_id == "user-1"
+        assert first.username == "alice"
+        assert second == first
+    
+    def test_decode_invalid_token(self):
+        """Test invalid tokens decode to None."""
+        assert auth_service.decode_token("not-a-jwt") is None
+    
+    def test_token_expiry_claims(self):
+        """Test access and refresh tokens carry their configured lifetimes."""
+        claims = {"sub": "user-1", "username": "alice"}
+        
+        before = int(time.time())
+        access = auth_service.decode_token(auth_service.create_access_token(data=claims))
+        refresh = auth_service.decode_token(auth_service.create_refresh_token(data=claims))
+        
+        access_lifetime = settings.access_token_expire_minutes * 60
+        refresh_lifetime = settings.refresh_token_expire_days * 86400
+        assert access_lifetime <= access.exp - before <= access_lifetime + 1
+        assert refresh_lifetime <= refresh.exp - before <= refresh_lifetime + 1
+    
+    def test_warm_up(self):
+        """Test backend warm-up runs without touching stored data."""
+        auth_service.warm_up()
+    
+    def test_decoded_token_type(self):
+        """Test decoded tokens report whether they are access or refresh tokens."""
+        claims = {"sub": "user-1", "username": "alice"}
+        
+        assert auth_service.decode_token(auth_service.create_access_token(data=claims)).token_type == "access"
+        assert auth_service.decode_token(auth_service.create_refresh_token(data=claims)).token_type == "refresh"
+
+
+class TestRefreshEndpoint:
+    """Test the /refresh endpoint."""
+    
+    def test_refresh_token_accepted(self, client, legacy_user):
+        """Test a refresh token is exchanged for a new token pair."""
+        claims = {"sub": legacy_user.id, "username": legacy_user.username}
+        response = client.post(
+            "/api/auth/refresh",
+            json={"refresh_token": auth_service.create_refresh_token(data=claims)}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["refresh_token"]
+    
+    def test_access_token_rejected(self, client, legacy_user):
+        """Test an access token cannot be used as a refresh token."""
+        claims = {"sub": legacy_user.id, "username": legacy_user.username}
+        response = client.post(
+            "/api/auth/refresh",
+            json={"refresh_token": auth_service.create_access_token(data=claims)}
+        )
+        
+        assert response.status_code == 401
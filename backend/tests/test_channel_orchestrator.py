@@ -1,10 +1,13 @@
 """Tests for channel orchestrator."""
 
+import asyncio
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import uuid
 
+from src.services.channels import gmail_channel
 from src.services.channel_orchestrator import channel_orchestrator
+from src.services.channels.base_channel import BaseChannel, ChannelError, CircuitBreaker, CircuitState
 from src.models.base import (
     Message,
     MessageType,
@@ -14,6 +17,8 @@ from src.models.base import (
     FeedbackType,
     FeedbackStatus,
     FeedbackMetadata,
+    ChannelConnection,
+    ChannelStatus,
 )
 from src.storage.memory_store import store
 
@@ -66,6 +71,25 @@ def test_feedback_request(test_session_id):
     )
 
 
+class FakeChannel:
+    """Channel stub whose feedback send waits on a shared barrier."""
+    
+    def __init__(self, started: asyncio.Event, other_started: asyncio.Event, fail: bool = False):
+        self.status = ChannelStatus.ACTIVE
+        self.circuit_breaker = CircuitBreaker()
+        self.started = started
+        self.other_started = other_started
+        self.fail = fail
+    
+    async def request_feedback(self, feedback_request, recipient):
+        self.started.set()
+        # Only completes if the other channel is being sent concurrently
+        await asyncio.wait_for(self.other_started.wait(), timeout=1)
+        if self.fail:
+            raise ChannelError("send failed")
+        return True
+
+
 class TestChannelOrchestrator:
     """Test channel orchestrator functionality."""
     
@@ -115,6 +139,150 @@ class TestChannelOrchestrator:
         )
         
         assert priority == [ChannelType.EMAIL]
+    
+    @pytest.mark.asyncio
+    async def test_send_feedback_request_fans_out_concurrently(
+        self, test_user_id, test_feedback_request
+    ):
+        """Test feedback requests go to all channels at once and skip failures."""
+        email_started, slack_started = asyncio.Event(), asyncio.Event()
+        channel_orchestrator.user_channels[test_user_id] = {
+            ChannelType.EMAIL: FakeChannel(email_started, slack_started),
+            ChannelType.SLACK: FakeChannel(slack_started, email_started, fail=True),
+        }
+        
+        successful = await channel_orchestrator.send_feedback_request(
+            test_feedback_request,
+            test_user_id,
+            recipient="user@example.com"
+        )
+        
+        assert successful == [ChannelType.EMAIL]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_channel_init_runs_once(self, test_user_id, monkeypatch):
+        """Test concurrent lookups share a single channel initialization."""
+        init_calls = []
+        
+        class CountingChannel:
+            status = ChannelStatus.INACTIVE
+            
+            async def initialize(self, user_id):
+                init_calls.append(user_id)
+                await asyncio.sleep(0.01)
+                self.status = ChannelStatus.ACTIVE
+                return True
+        
+        monkeypatch.setattr(gmail_channel, "GmailChannel", CountingChannel)
+        
+        channels = await asyncio.gather(*(
+            channel_orchestrator._get_or_create_channel(test_user_id, ChannelType.EMAIL)
+            for _ in range(5)
+        ))
+        
+        assert len(init_calls) == 1
+        assert all(channel is channels[0] for channel in channels)
+        assert (test_user_id, ChannelType.EMAIL) not in channel_orchestrator._init_locks
+    
+    @pytest.mark.asyncio
+    async def test_send_message_records_one_attempt(self, test_user_id, test_message):
+        """Test a delivery is recorded once and updated with its final status."""
+        class SendingChannel:
+            status = ChannelStatus.ACTIVE
+            circuit_breaker = CircuitBreaker()
+            
+            async def send_message(self, message, recipient, subject=None):
+                return True
+        
+        channel_orchestrator.user_channels[test_user_id] = {ChannelType.EMAIL: SendingChannel()}
+        
+        sent = await channel_orchestrator.send_message(
+            test_message,
+            test_user_id,
+            recipient="user@example.com",
+            preferred_channel=ChannelType.EMAIL,
+            enable_fallback=False
+        )
+        
+        history = channel_orchestrator.get_delivery_history(test_message.id)
+        assert sent
+        assert len(history) == 1
+        assert history[0].status == MessageStatus.DELIVERED
+        assert history[0].attempt_number == 1
+        assert history[0].id == f"{test_message.id}-1"
+        assert store.count_message_delivery_attempts(test_message.id) == 1
+
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def test_opens_at_threshold_and_stays_open(self):
+        """Test the circuit blocks calls until its timeout elapses."""
+        breaker = CircuitBreaker(failure_threshold=2, timeout_seconds=60)
+        
+        breaker.record_failure()
+        assert breaker.can_execute()
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.can_execute()
+    
+    def test_half_open_after_timeout(self):
+        """Test an elapsed timeout lets a trial call through and success closes it."""
+        breaker = CircuitBreaker(failure_threshold=1, timeout_seconds=0)
+        breaker.record_failure()
+        
+        assert breaker.can_execute()
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestChannelConnection:
+    """Test channel connection token expiry."""
+    
+    def test_token_expired(self):
+        """Test naive google-auth expiries are read as UTC."""
+        now = datetime.now(timezone.utc)
+        connection = ChannelConnection(
+            user_id=str(uuid.uuid4()),
+            channel_type=ChannelType.EMAIL,
+            access_token="token",
+            token_expires_at=(now - timedelta(minutes=5)).replace(tzinfo=None),
+            created_at=now,
+            updated_at=now
+        )
+        
+        assert connection.token_expires_at.tzinfo is timezone.utc
+        assert connection.token_expired
+        
+        connection.token_expires_at = (now + timedelta(hours=1)).replace(tzinfo=None)
+        assert not connection.token_expired
+
+
+
+class TestSharedHttpSession:
+    """Test the HTTP session shared by channels."""
+    
+    def test_session_recreated_for_new_loop(self):
+        """Test a new event loop gets its own session instead of a stale one."""
+        async def get_sessions():
+            return BaseChannel.http_session(), BaseChannel.http_session()
+        
+        async def get_and_close():
+            session = BaseChannel.http_session()
+            await BaseChannel.close_http_session()
+            return session
+        
+        first, again = asyncio.run(get_sessions())
+        second = asyncio.run(get_and_close())
+        
+        assert first is again
+        assert second is not first
+        assert second.closed
+        assert BaseChannel._http_session is None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+"""Tests for WebSocket connection manager."""
+
+import pytest
+import uuid
+
+from pydantic import BaseModel
+from fastapi import WebSocketDisconnect
+
+from src.api.websocket.manager import ConnectionManager
+
+
+class Notice(BaseModel):
+    """Simple message model for broadcasts."""
+    type: str
+    text: str
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording sent frames."""
+    
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+    
+    async def accept(self):
+        pass
+    
+    async def send_text(self, data: str):
+        if self.fail:
+            raise WebSocketDisconnect()
+        self.sent.append(data)
+
+
+@pytest.fixture
+def manager():
+    """Create a fresh connection manager."""
+    return ConnectionManager()
+
+
+@pytest.fixture
+def user_id():
+    """Generate a test user ID."""
+    return str(uuid.uuid4())
+
+
+class TestConnectionManager:
+    """Test ConnectionManager fan-out and bookkeeping."""
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_to_user(self, manager, user_id):
+        """Test a broadcast reaches every session of the user once."""
+        sockets = [FakeWebSocket(), FakeWebSocket()]
+        for websocket in sockets:
+            await manager.connect(websocket, str(uuid.uuid4()), user_id)
+        
+        other = FakeWebSocket()
+        await manager.connect(other, str(uuid.uuid4()), str(uuid.uuid4()))
+        
+        await manager.broadcast_to_user(user_id, Notice(type="notice", text="hi"))
+        
+        assert all(websocket.sent == ['{"type":"notice","text":"hi"}'] for websocket in sockets)
+        assert other.sent == []
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_sessions(self, manager, user_id):
+        """Test sessions whose send fails are disconnected."""
+        await manager.connect(FakeWebSocket(), "alive", user_id)
+        await manager.connect(FakeWebSocket(fail=True), "dead", user_id)
+        
+        await manager.broadcast_to_user(user_id, Notice(type="notice", text="hi"))
+        
+        assert manager.get_connection("alive") is not None
+        assert manager.get_connection("dead") is None
+        assert manager.get_user_session_count(user_id) == 1
+    
+    @pytest.mark.asyncio
+    async def test_session_counts(self, manager, user_id):
+        """Test per-user session counts track connects, re-binds and disconnects."""
+        await manager.connect(FakeWebSocket(), "s1", user_id)
+        await manager.connect(FakeWebSocket(), "s2", user_id)
+        await manager.connect(FakeWebSocket(), "s2", user_id)
+        assert manager.get_user_session_count(user_id) == 2
+        
+        manager.disconnect("s1")
+        manager.disconnect("s1")
+        assert manager.get_user_session_count(user_id) == 1
+        
+        manager.disconnect("s2")
+        assert manager.get_user_session_count(user_id) == 0
+        assert manager.user_counts == {}
+    
+    @pytest.mark.asyncio
+    async def test_send_to_sessions(self, manager, user_id):
+        """Test sending to an explicit session list skips unknown sessions."""
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(first, "s1", user_id)
+        await manager.connect(second, "s2", str(uuid.uuid4()))
+        
+        await manager.send_to_sessions(["s1", "s2", "missing"], '{"type":"ping"}')
+        
+        assert first.sent == ['{"type":"ping"}']
+        assert second.sent == ['{"type":"ping"}']
@@ -0,0 +1,105 @@
+"""Tests for the Gmail OAuth callback feeding the email channel handler."""
+
+import importlib
+import sys
+import types
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import email
+from src.models.base import ChannelType, Message, MessageStatus, MessageType
+from src.models.user import User
+from src.services.auth_service import auth_service
+from src.services.email_service import email_service
+from src.services.session_service import session_service
+from src.storage.memory_store import store
+
+
+@pytest.fixture
+def user():
+    """Create a stored user."""
+    now = datetime.now(timezone.utc)
+    return store.create_user(User(
+        id=str(uuid.uuid4()),
+        email=f"{uuid.uuid4().hex[:8]}@example.com",
+        username=f"user_{uuid.uuid4().hex[:8]}",
+        hashed_password="unused",
+        is_active=True,
+        created_at=now,
+        updated_at=now
+    ))
+
+
+@pytest.fixture
+def email_handler(monkeypatch):
+    """Import the email handler with the agent replaced by a canned reply."""
+    async def process_user_message(session_id, user_message, channel):
+        return types.SimpleNamespace(content=f"Re: {user_message}")
+    
+    fake_agent = types.ModuleType("src.services.agent_service")
+    fake_agent.agent_service = types.SimpleNamespace(process_user_message=process_user_message)
+    monkeypatch.setitem(sys.modules, "src.services.agent_service", fake_agent)
+    monkeypatch.delitem(sys.modules, "src.api.websocket.email_handler", raising=False)
+    monkeypatch.setattr(session_service, "update_agent_status", lambda *args: None)
+    monkeypatch.setattr(session_service, "update_message_status", lambda *args: None)
+    return importlib.import_module("src.api.websocket.email_handler")
+
+
+def make_message(session_id: str, content: str, message_type: MessageType) -> Message:
+    """Create an email channel message."""
+    return Message(
+        id=str(uuid.uuid4()),
+        session_id=session_id,
+        content=content,
+        type=message_type,
+        timestamp=datetime.now(timezone.utc),
+        status=MessageStatus.SENT,
+        channel=ChannelType.EMAIL
+    )
+
+
+class TestGmailCallbackToEmailHandler:
+    """Test tokens stored by the OAuth callback are used to send email."""
+    
+    @pytest.mark.asyncio
+    async def test_callback_tokens_used_for_send(self, monkeypatch, user, email_handler):
+        """Test the handler sends with the access token the callback stored."""
+        async def exchange_code(code):
+            return {"access_token": "access-1", "refresh_token": "refresh-1", "expires_in": 3600}
+        
+        sent = []
+        
+        async def send_message(session_id, content, to_email, access_token):
+            sent.append((to_email, access_token, content))
+            return make_message(session_id, content, MessageType.AGENT)
+        
+        monkeypatch.setattr(email_service, "exchange_code", exchange_code)
+        monkeypatch.setattr(email_service, "send_message", send_message)
+        
+        app = FastAPI()
+        app.include_router(email.router)
+        token = auth_service.create_access_token(data={"sub": user.id, "username": user.username})
+        response = TestClient(app).get(
+            "/api/auth/gmail/callback",
+            params={"code": "auth-code"},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        
+        assert response.status_code == 200
+        connection = store.get_channel_connection(user.id, ChannelType.EMAIL)
+        assert connection.access_token == "access-1"
+        assert connection.refresh_token == "refresh-1"
+        
+        session_id = str(uuid.uuid4())
+        result = await email_handler.handle_email_message(
+            session_id,
+            user.id,
+            make_message(session_id, "hello", MessageType.USER)
+        )
+        
+        assert result.type == MessageType.AGENT
+        assert sent == [(user.email, "access-1", "Re: hello")]
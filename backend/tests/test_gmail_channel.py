@@ -0,0 +1,107 @@
+"""Tests for Gmail channel email formatting."""
+
+import base64
+import email
+from email.header import decode_header, make_header
+import pytest
+from datetime import datetime, timezone
+import uuid
+
+from src.services.channels.gmail_channel import GmailChannel, _build_raw_message
+from src.models.base import (
+    Message,
+    MessageType,
+    MessageStatus,
+    ChannelType,
+    FeedbackRequest,
+    FeedbackType,
+    FeedbackStatus,
+    FeedbackMetadata,
+)
+
+
+EXPIRES = "2026-01-01 00:00:00 UTC"
+
+
+@pytest.fixture
+def channel():
+    """Create an uninitialized Gmail channel."""
+    return GmailChannel()
+
+
+def make_feedback_request(feedback_type: FeedbackType) -> FeedbackRequest:
+    """Create a feedback request of the given type."""
+    now = datetime.now(timezone.utc)
+    return FeedbackRequest(
+        id=str(uuid.uuid4()),
+        session_id=str(uuid.uuid4()),
+        type=feedback_type,
+        status=FeedbackStatus.PENDING,
+        prompt="Deploy <b>prod</b>?",
+        created_at=now,
+        expires_at=now,
+        channels=[ChannelType.EMAIL],
+        metadata=FeedbackMetadata(priority=1, attempts_count=0, last_attempt=now)
+    )
+
+
+class TestGmailFormatting:
+    """Test HTML and plain text email bodies."""
+    
+    def test_message_html_escapes_content(self, channel):
+        """Test agent content is escaped in the HTML body."""
+        message = Message(
+            id=str(uuid.uuid4()),
+            session_id=str(uuid.uuid4()),
+            content="<script>alert(1)</script>",
+            type=MessageType.AGENT,
+            timestamp=datetime.now(timezone.utc),
+            status=MessageStatus.SENT,
+            channel=ChannelType.EMAIL
+        )
+        
+        body = channel._format_message_html(message)
+        
+        assert "<script>" not in body
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in body
+    
+    def test_feedback_html_escapes_prompt(self, channel):
+        """Test feedback prompts are escaped and carry type-specific instructions."""
+        approval = channel._format_feedback_html(make_feedback_request(FeedbackType.APPROVAL), EXPIRES)
+        user_input = channel._format_feedback_html(make_feedback_request(FeedbackType.INPUT), EXPIRES)
+        
+        assert "Deploy &lt;b&gt;prod&lt;/b&gt;?" in approval
+        assert "Approval Required" in approval and "APPROVE" in approval
+        assert "Input Required" in user_input and "Reply with your input" in user_input
+    
+    def test_feedback_plain_uses_type_copy(self, channel):
+        """Test plain text bodies carry the heading and action for each type."""
+        approval = channel._format_feedback_plain(make_feedback_request(FeedbackType.APPROVAL), EXPIRES)
+        user_input = channel._format_feedback_plain(make_feedback_request(FeedbackType.INPUT), EXPIRES)
+        
+        assert "APPROVAL REQUIRED" in approval and "APPROVE/YES or REJECT/NO" in approval
+        assert f"Expires: {EXPIRES}" in approval
+        assert "INPUT REQUIRED" in user_input and "Reply with your input" in user_input
+
+
+class TestRawMessage:
+    """Test Gmail raw message encoding."""
+    
+    def test_build_raw_message_round_trip(self):
+        """Test the encoded message parses back with headers and both bodies."""
+        raw = _build_raw_message(
+            "user@example.com",
+            "Approval Required - Déployer?",
+            {"X-Session-ID": "session-1"},
+            "<p>Hello</p>",
+            "Hello"
+        )
+        
+        parsed = email.message_from_bytes(base64.urlsafe_b64decode(raw))
+        parts = parsed.get_payload()
+        
+        assert parsed["to"] == "user@example.com"
+        assert parsed["X-Session-ID"] == "session-1"
+        assert str(make_header(decode_header(parsed["subject"]))) == "Approval Required - Déployer?"
+        assert [part.get_content_type() for part in parts] == ["text/html", "text/plain"]
+        assert parts[1].get_payload(decode=True) == b"Hello"
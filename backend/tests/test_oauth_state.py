@@ -0,0 +1,46 @@
+"""Tests for stateless OAuth state tokens."""
+
+import pytest
+import time
+
+from src.services import oauth_state
+from src.services.oauth_state import create_oauth_state, verify_oauth_state
+
+
+class TestOAuthState:
+    """Test OAuth state signing and verification."""
+    
+    def test_round_trip(self):
+        """Test a freshly issued state resolves to its user."""
+        state = create_oauth_state("user123")
+        
+        assert verify_oauth_state(state) == "user123"
+    
+    def test_states_are_unique(self):
+        """Test each state carries its own nonce."""
+        assert create_oauth_state("user123") != create_oauth_state("user123")
+    
+    def test_tampered_state_rejected(self):
+        """Test a state with a modified payload is rejected."""
+        state = create_oauth_state("user123")
+        forged = create_oauth_state("attacker")
+        tampered = forged.split(".")[0] + "." + state.split(".")[1]
+        
+        assert verify_oauth_state(tampered) is None
+    
+    @pytest.mark.parametrize("state", ["", "garbage", "a.b.c", "!!!.???"])
+    def test_malformed_state_rejected(self, state):
+        """Test malformed states are rejected without raising."""
+        assert verify_oauth_state(state) is None
+    
+    def test_expired_state_rejected(self, monkeypatch):
+        """Test states older than the consent window are rejected."""
+        state = create_oauth_state("user123")
+        issued = time.time()
+        monkeypatch.setattr(
+            oauth_state.time,
+            "time",
+            lambda: issued + oauth_state.STATE_TTL_SECONDS + 1
+        )
+        
+        assert verify_oauth_state(state) is None
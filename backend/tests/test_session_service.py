@@ -136,6 +136,43 @@ class TestSessionService:
         assert feedback.type == FeedbackType.APPROVAL
         assert len(feedback.channels) == 2
     
+    def test_submit_feedback_response_wrong_session(self, clean_store):
+        """Test responding through another session's ID is rejected."""
+        session = session_service.create_session(
+            user_id=str(uuid4()),
+            preferred_channel=ChannelType.WEBSOCKET,
+            user_agent="test",
+            ip_address="127.0.0.1"
+        )
+        other_session = session_service.create_session(
+            user_id=str(uuid4()),
+            preferred_channel=ChannelType.WEBSOCKET,
+            user_agent="test",
+            ip_address="127.0.0.1"
+        )
+        feedback = session_service.create_feedback_request(
+            session_id=session.id,
+            feedback_type=FeedbackType.APPROVAL,
+            prompt="Do you approve this action?",
+            channels=[ChannelType.WEBSOCKET]
+        )
+        
+        with pytest.raises(ValidationError, match="not found"):
+            session_service.submit_feedback_response(
+                request_id=feedback.id,
+                content="yes",
+                channel=ChannelType.WEBSOCKET,
+                session_id=other_session.id
+            )
+        
+        response = session_service.submit_feedback_response(
+            request_id=feedback.id,
+            content="yes",
+            channel=ChannelType.WEBSOCKET,
+            session_id=session.id
+        )
+        assert response.request_id == feedback.id
+    
     def test_end_session(self, clean_store):
         """Test ending a session."""
         # Create session
@@ -0,0 +1,85 @@
+"""Tests for the Slack events webhook."""
+
+import pytest
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import slack
+
+
+SIGNING_SECRET = "test-signing-secret"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a test client for the Slack router with a known signing secret."""
+    monkeypatch.setattr(slack.settings, "slack_signing_secret", SIGNING_SECRET)
+    app = FastAPI()
+    app.include_router(slack.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def handled_events(monkeypatch):
+    """Record events passed to the Slack event handler."""
+    events = []
+    
+    async def handle_event(event):
+        events.append(event)
+    
+    monkeypatch.setattr(slack.slack_event_handler, "handle_event", handle_event)
+    return events
+
+
+def post_event(client, payload: dict):
+    """Post a signed event payload to the webhook."""
+    body = json.dumps(payload).encode()
+    timestamp = str(int(time.time()))
+    basestring = f"v0:{timestamp}:".encode() + body
+    signature = "v0=" + hmac.new(SIGNING_SECRET.encode(), basestring, hashlib.sha256).hexdigest()
+    return client.post(
+        "/api/channels/slack/events",
+        content=body,
+        headers={
+            "X-Slack-Request-Timestamp": timestamp,
+            "X-Slack-Signature": signature
+        }
+    )
+
+
+class TestSlackEvents:
+    """Test the /events endpoint."""
+    
+    def test_url_verification(self, client):
+        """Test the URL verification challenge is echoed back."""
+        response = post_event(client, {"type": "url_verification", "challenge": "abc"})
+        
+        assert response.status_code == 200
+        assert response.json() == {"challenge": "abc"}
+    
+    def test_retried_event_handled_once(self, client, handled_events):
+        """Test Slack retries of the same event_id are acknowledged but not re-handled."""
+        payload = {
+            "type": "event_callback",
+            "event_id": f"Ev{uuid.uuid4().hex}",
+            "event": {"type": "message", "text": "hi"}
+        }
+        
+        assert post_event(client, payload).json() == {"status": "ok"}
+        assert post_event(client, payload).json() == {"status": "ok"}
+        
+        assert len(handled_events) == 1
+    
+    def test_events_without_ids_all_handled(self, client, handled_events):
+        """Test events lacking an event_id and timestamp are not collapsed together."""
+        for text in ("first", "second"):
+            payload = {"type": "event_callback", "event": {"type": "message", "text": text}}
+            assert post_event(client, payload).json() == {"status": "ok"}
+        
+        assert [event["text"] for event in handled_events] == ["first", "second"]
@@ -0,0 +1,53 @@
+"""Tests for Slack request signature verification."""
+
+import pytest
+import hashlib
+import hmac
+import time
+
+from src.api.routers import slack
+
+
+SIGNING_SECRET = "test-signing-secret"
+BODY = b'{"type": "event_callback"}'
+
+
+@pytest.fixture(autouse=True)
+def signing_secret(monkeypatch):
+    """Configure a known Slack signing secret."""
+    monkeypatch.setattr(slack.settings, "slack_signing_secret", SIGNING_SECRET)
+
+
+def sign(body: bytes, timestamp: str) -> str:
+    """Compute the Slack signature for a request."""
+    basestring = f"v0:{timestamp}:".encode() + body
+    return "v0=" + hmac.new(SIGNING_SECRET.encode(), basestring, hashlib.sha256).hexdigest()
+
+
+class TestVerifySlackSignature:
+    """Test verify_slack_signature."""
+    
+    def test_valid_signature(self):
+        """Test a fresh, correctly signed request is accepted."""
+        timestamp = str(int(time.time()))
+        assert slack.verify_slack_signature(BODY, timestamp, sign(BODY, timestamp))
+    
+    def test_tampered_body(self):
+        """Test a signature over a different body is rejected."""
+        timestamp = str(int(time.time()))
+        assert not slack.verify_slack_signature(b"{}", timestamp, sign(BODY, timestamp))
+    
+    def test_stale_timestamp(self):
+        """Test requests outside the replay window are rejected."""
+        timestamp = str(int(time.time()) - slack.SIGNATURE_MAX_AGE_SECONDS - 60)
+        assert not slack.verify_slack_signature(BODY, timestamp, sign(BODY, timestamp))
+    
+    @pytest.mark.parametrize("timestamp", ["", "not-a-number"])
+    def test_malformed_timestamp(self, timestamp):
+        """Test missing or non-numeric timestamps are rejected."""
+        assert not slack.verify_slack_signature(BODY, timestamp, "v0=" + "0" * 64)
+    
+    @pytest.mark.parametrize("signature", ["", "v0=abc", "v1=" + "0" * 64])
+    def test_malformed_signature(self, signature):
+        """Test signatures of the wrong shape are rejected."""
+        assert not slack.verify_slack_signature(BODY, str(int(time.time())), signature)
@@ -50,8 +50,10 @@ export function useWebSocket({
 
       ws.current.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data) as WebSocketMessage;
-          onMessage?.(data);
+          // The server batches back-to-back envelopes into a JSON array
+          const data = JSON.parse(event.data) as WebSocketMessage | WebSocketMessage[];
+          const messages = Array.isArray(data) ? data : [data];
+          messages.forEach((message) => onMessage?.(message));
         } catch (error) {
           console.error("Failed to parse WebSocket message:", error);
         }